@@ -5,12 +5,16 @@ Base HTTP client with debug logging and TLS verification disabled.
 
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Any, Optional, Tuple
 
-import time
+import threading
+from urllib.parse import urlencode
 
 from config import config, API_V4, API_V5
 from utils.debug import debug_request, debug_response, debug_log
+from utils import fastjson, http_cache
 
 # Disable SSL warnings (as requested)
 #urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -24,9 +28,24 @@ class HTBClient:
     
     def __init__(self):
         self.session = requests.Session()
+        # Keep-alive pool so consecutive calls (e.g. the seasons worker's
+        # list + profile + leaderboard burst) reuse warm TLS connections
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Set on app exit so retry loops on pool threads stop waiting
+        self._shutdown = threading.Event()
         #self.session.verify = False  # Disable TLS verification as requested
         debug_log("CLIENT", "HTBClient initialized")
     
+    def shutdown(self):
+        """Abort pending retries so background loads can finish promptly."""
+        self._shutdown.set()
+    
     def _get_headers(self) -> dict:
         """Get request headers with authorization."""
         headers = {
@@ -43,22 +62,37 @@ class HTBClient:
     def _request_with_retry(self, method: str, endpoint: str, 
                           params: Optional[dict] = None, 
                           data: Optional[dict] = None,
-                          version: str = "v4") -> Tuple[bool, Any]:
+                          version: str = "v4",
+                          conditional: bool = False) -> Tuple[bool, Any]:
         """
         Internal method to handle requests with retry logic.
         Retries on connection errors, timeouts, and server errors (5xx/429).
         Waits 10 seconds between retries.
+        
+        When conditional is set, GET responses are cached on disk and
+        revalidated with ETag/Last-Modified; a 304 replays the cached body.
         """
         base = API_V4 if version == "v4" else API_V5
         url = f"{base}{endpoint}"
         
+        cache_key = None
+        cached = None
+        if conditional and method == "GET":
+            cache_key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+            cached = http_cache.get_entry(cache_key)
+            if cached and http_cache.is_fresh(cached):
+                debug_log("CLIENT", f"Cache hit (fresh): {cache_key}")
+                return True, cached.get("body")
+        
         while True:
             debug_request(method, url, data if method == "POST" else params)
             
             try:
                 if method == "GET":
+                    headers = self._get_headers()
+                    headers.update(http_cache.get_validators(cached))
                     response = self.session.get(
-                        url, headers=self._get_headers(), params=params, timeout=30
+                        url, headers=headers, params=params, timeout=30
                     )
                 else:
                     response = self.session.post(
@@ -70,13 +104,20 @@ class HTBClient:
                     error_msg = f"HTTP {response.status_code} - Server Error/Rate Limit"
                     debug_response(response.status_code, url, error_msg)
                     debug_log("CLIENT", f"API Issue ({response.status_code}). Retrying in 10s...")
-                    time.sleep(10)
+                    if self._shutdown.wait(10):
+                        return False, "Client shutting down"
                     continue
                 
+                # Not modified - replay cached body
+                if response.status_code == 304 and cached:
+                    debug_response(response.status_code, url, "Not Modified (cached)")
+                    http_cache.touch_entry(cache_key, cached)
+                    return True, cached.get("body")
+                
                 # Check for API errors (4xx)
                 if response.status_code >= 400:
                     try:
-                        resp_data = response.json()
+                        resp_data = fastjson.loads(response.content)
                         error_msg = resp_data.get('message', resp_data.get('error', f'HTTP {response.status_code}'))
                     except:
                         error_msg = f"HTTP {response.status_code}"
@@ -88,16 +129,19 @@ class HTBClient:
                 content_type = response.headers.get('Content-Type', '')
                 if 'application/json' in content_type:
                     try:
-                        resp_data = response.json()
+                        resp_data = fastjson.loads(response.content)
                         # If data is None or empty, maybe retry? 
                         # User said "no retorna datos". 
                         # But some APIs return empty 200 OK. 
                         # We'll assume strict JSON parsing error or actual connection fail covers "active/down".
                         debug_response(response.status_code, url, resp_data)
+                        if cache_key:
+                            http_cache.save_entry(cache_key, response.headers, resp_data)
                         return True, resp_data
                     except ValueError:
                         debug_log("CLIENT", "Invalid JSON response. Retrying in 10s...")
-                        time.sleep(10)
+                        if self._shutdown.wait(10):
+                            return False, "Client shutting down"
                         continue
                 else:
                     debug_response(response.status_code, url, f"Binary/Other ({len(response.content)} bytes)")
@@ -106,7 +150,8 @@ class HTBClient:
             except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
                 debug_response(0, url, error=str(e))
                 debug_log("CLIENT", f"Connection failed: {e}. Retrying in 10s...")
-                time.sleep(10)
+                if self._shutdown.wait(10):
+                    return False, "Client shutting down"
                 continue
                 
             except Exception as e:
@@ -114,9 +159,10 @@ class HTBClient:
                 return False, f"Unexpected error: {str(e)}"
 
     def get(self, endpoint: str, params: Optional[dict] = None, 
-            version: str = "v4") -> Tuple[bool, Any]:
-        """Make a GET request with retry."""
-        return self._request_with_retry("GET", endpoint, params=params, version=version)
+            version: str = "v4", conditional: bool = False) -> Tuple[bool, Any]:
+        """Make a GET request with retry (optionally ETag-revalidated)."""
+        return self._request_with_retry("GET", endpoint, params=params,
+                                        version=version, conditional=conditional)
     
     def post(self, endpoint: str, data: Optional[dict] = None,
              version: str = "v4") -> Tuple[bool, Any]:
@@ -28,13 +28,13 @@ class HTBApi:
     def get_seasons() -> Tuple[bool, Any]:
         """Get list of all seasons."""
         debug_log("API", "Fetching seasons list...")
-        return client.get("/season/list")
+        return client.get("/season/list", conditional=True)
     
     @staticmethod
     def get_season_machines(season_id: int) -> Tuple[bool, Any]:
         """Get machines for a specific season."""
         debug_log("API", f"Fetching machines for season {season_id}...")
-        return client.get(f"/season/machines/{season_id}")
+        return client.get(f"/season/machines/{season_id}", conditional=True)
     
     @staticmethod
     def get_active_season_machine() -> Tuple[bool, Any]:
@@ -48,7 +48,8 @@ class HTBApi:
         debug_log("API", f"Fetching leaderboard for season {season_id}...")
         return client.get(
             "/season/players/leaderboard",
-            params={"per_page": per_page, "season": season_id}
+            params={"per_page": per_page, "season": season_id},
+            conditional=True
         )
     
     # ==================== MACHINES ====================
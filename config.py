@@ -24,6 +24,9 @@ CONFIG_FILE = CONFIG_DIR / "config.json"
 # Debug mode from env or default
 DEBUG = os.getenv("HTB_DEBUG", "true").lower() == "true"
 
+# Skip page transition animations (env or config.json)
+REDUCED_MOTION = os.getenv("HTB_REDUCED_MOTION", "false").lower() == "true"
+
 
 class Config:
     """Configuration manager for HTB Client."""
@@ -31,6 +34,7 @@ class Config:
     _instance = None
     _api_token: str = ""
     _debug: bool = DEBUG
+    _reduced_motion: bool = REDUCED_MOTION
     
     def __new__(cls):
         if cls._instance is None:
@@ -55,6 +59,7 @@ class Config:
                     data = json.load(f)
                     self._api_token = data.get('api_token', '')
                     self._debug = data.get('debug', DEBUG)
+                    self._reduced_motion = data.get('reduced_motion', REDUCED_MOTION)
                     if self._debug:
                         print(f"[DEBUG] Config loaded from {CONFIG_FILE}")
             except Exception as e:
@@ -67,7 +72,8 @@ class Config:
             with open(CONFIG_FILE, 'w') as f:
                 json.dump({
                     'api_token': self._api_token,
-                    'debug': self._debug
+                    'debug': self._debug,
+                    'reduced_motion': self._reduced_motion
                 }, f, indent=2)
             if self._debug:
                 print(f"[DEBUG] Config saved to {CONFIG_FILE}")
@@ -95,6 +101,15 @@ class Config:
         self._save_config()
         print(f"[DEBUG] Debug mode: {value}")
     
+    @property
+    def reduced_motion(self) -> bool:
+        return self._reduced_motion
+    
+    @reduced_motion.setter
+    def reduced_motion(self, value: bool):
+        self._reduced_motion = value
+        self._save_config()
+    
     def is_configured(self) -> bool:
         """Check if API token is configured."""
         return bool(self._api_token)
@@ -12,11 +12,30 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
+from PySide6.QtGui import QFont, QFontDatabase
 
 from config import config
 from ui.main_window import MainWindow
 from utils.debug import debug_log
+from utils.image_cache import setup_pixmap_cache
+
+
+PREFERRED_FAMILIES = ["Inter", "Segoe UI", "SF Pro Display", "Roboto"]
+
+
+def _setup_fonts(app: QApplication):
+    """
+    Set the application font once, from the first installed preferred family.
+    
+    The stylesheet no longer names a family, so every widget inherits this
+    resolved font instead of walking a fallback list at style time.
+    """
+    available = set(QFontDatabase.families())
+    family = next((f for f in PREFERRED_FAMILIES if f in available), None)
+    font = QFont(family) if family else QFont()
+    font.setPointSize(10)
+    font.setWeight(QFont.Weight.Normal)
+    app.setFont(font)
 
 
 def main():
@@ -30,12 +49,11 @@ def main():
     app.setApplicationName("HTB Client")
     app.setApplicationVersion("1.0.0")
     
-    # Set default font - try Inter, fallback to system fonts
-    font = QFont()
-    font.setFamilies(["Inter", "Segoe UI", "SF Pro Display", "Roboto"])
-    font.setPointSize(10)
-    font.setWeight(QFont.Weight.Normal)
-    app.setFont(font)
+    # Set default font - Inter if installed, else the next preferred family or system default
+    _setup_fonts(app)
+    
+    # Decoded avatars live in QPixmapCache; disk is the cold tier
+    setup_pixmap_cache()
     
     # High DPI scaling is enabled by default in Qt6
     
@@ -3,9 +3,10 @@
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QStackedWidget, QStatusBar, QLabel, QSizeGrip
 )
-from PySide6.QtCore import Qt, Slot, QSize, QPoint
+from PySide6.QtCore import Qt, Slot, QSize, QPoint, QThreadPool
 from PySide6.QtGui import QCloseEvent, QColor, QPalette
 
+from api.client import client
 from config import config
 from ui.styles import GLOBAL_STYLE, HTB_GREEN, HTB_TEXT_MUTED, HTB_BG_DARKEST
 from ui.top_nav import TopNav
@@ -39,6 +40,10 @@ class MainWindow(QMainWindow):
         for page in pages_with_threads:
             if hasattr(page, "stop_background_tasks"):
                 page.stop_background_tasks()
+        # Pool tasks can't be killed: drop queued ones and cut retry waits
+        # short so the pool drains before Qt waits on it at exit.
+        QThreadPool.globalInstance().clear()
+        client.shutdown()
         event.accept()
     
     def _setup_window(self):
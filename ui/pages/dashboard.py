@@ -20,6 +20,7 @@ from ui.widgets.modern_widgets import (
     ModernButton, ModernCard, SimpleStatCard, ModernInput
 )
 from utils.debug import debug_log
+from utils.image_cache import get_cached_image, save_to_cache
 import qtawesome as qta
 
 
@@ -488,25 +489,26 @@ class DashboardPage(QWidget):
         if reply.error() != QNetworkReply.NoError:
             reply.deleteLater()
             return
-        data = reply.readAll()
-        pixmap = QPixmap()
-        pixmap.loadFromData(data)
-        if not pixmap.isNull():
-            from PySide6.QtGui import QPainter, QPainterPath
-            scaled = pixmap.scaled(60, 60, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-            rounded = QPixmap(60, 60)
-            rounded.fill(Qt.transparent)
-            painter = QPainter(rounded)
-            painter.setRenderHint(QPainter.Antialiasing)
-            path = QPainterPath()
-            path.addRoundedRect(0, 0, 60, 60, 12, 12)
-            painter.setClipPath(path)
-            painter.drawPixmap(0, 0, scaled)
-            painter.end()
-            self.machine_avatar.setPixmap(rounded)
-            self.machine_avatar.setStyleSheet("background: transparent;")
+        pixmap = save_to_cache(reply.property("url"), reply.readAll())
+        if pixmap:
+            self._set_machine_avatar(pixmap)
         reply.deleteLater()
 
+    def _set_machine_avatar(self, pixmap: QPixmap):
+        from PySide6.QtGui import QPainter, QPainterPath
+        scaled = pixmap.scaled(60, 60, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+        rounded = QPixmap(60, 60)
+        rounded.fill(Qt.transparent)
+        painter = QPainter(rounded)
+        painter.setRenderHint(QPainter.Antialiasing)
+        path = QPainterPath()
+        path.addRoundedRect(0, 0, 60, 60, 12, 12)
+        painter.setClipPath(path)
+        painter.drawPixmap(0, 0, scaled)
+        painter.end()
+        self.machine_avatar.setPixmap(rounded)
+        self.machine_avatar.setStyleSheet("background: transparent;")
+
     def _on_stop_clicked(self):
         if not self._active_machine_id: return
         r = QMessageBox.question(
@@ -606,8 +608,12 @@ class DashboardPage(QWidget):
             if m.avatar:
                 self._active_machine_avatar = m.avatar
                 self.machine_avatar.setVisible(True)
-                req = QNetworkRequest(QUrl(m.avatar))
-                self._machine_avatar_network.get(req)
+                cached = get_cached_image(m.avatar)
+                if cached:
+                    self._set_machine_avatar(cached)
+                else:
+                    reply = self._machine_avatar_network.get(QNetworkRequest(QUrl(m.avatar)))
+                    reply.setProperty("url", m.avatar)
             else:
                 self.machine_avatar.setVisible(False)
         else:
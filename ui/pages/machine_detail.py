@@ -208,7 +208,6 @@ class MachineDetailPage(QWidget):
         
         # Back
         back_btn = ModernButton(" Back to Machines", "fa5s.arrow-left", "ghost")
-        back_btn.setStyleSheet(back_btn.styleSheet() + "text-align: left; padding-left: 0;")
         back_btn.setFixedWidth(200)
         back_btn.clicked.connect(self.back_clicked.emit)
         layout.addWidget(back_btn)
@@ -280,7 +279,7 @@ class MachineDetailPage(QWidget):
         # Machine actions: una sola tarjeta (Spawn/Reset/Stop + IP + Flag + status)
         actions_frame = QFrame()
         actions_frame.setObjectName("actions_card")
-        actions_frame.setStyleSheet(f"background-color: {HTB_BG_MAIN}; border-radius: 14px;")
+        actions_frame.setStyleSheet(f"QFrame {{ background-color: {HTB_BG_MAIN}; border-radius: 14px; }}")
         actions_frame.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
         
         actions_layout = QVBoxLayout(actions_frame)
@@ -389,7 +388,7 @@ class MachineDetailPage(QWidget):
         self.activity_scroll = QScrollArea()
         self.activity_scroll.setWidgetResizable(True)
         self.activity_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.activity_scroll.setStyleSheet("background: transparent; border: none;")
+        self.activity_scroll.setStyleSheet("QScrollArea, QScrollBar { background: transparent; border: none; }")
         self.activity_scroll.setFrameShape(QFrame.NoFrame)
         self._activity_container = QWidget()
         self._activity_layout = QVBoxLayout(self._activity_container)
@@ -4,18 +4,17 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QLineEdit, QComboBox, QScrollArea, QGridLayout, QSizePolicy
 )
-from PySide6.QtCore import Qt, Signal, Slot, QThread, QObject, QUrl
+from PySide6.QtCore import Qt, Signal, Slot, QThread, QObject, QUrl, QTimer, QRect, QThreadPool
 from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
-from PySide6.QtGui import QPixmap
-from typing import List, Dict
+from typing import List, Dict, Set
 
 from api.endpoints import HTBApi
 from models.machine import Machine
 from ui.styles import HTB_TEXT_DIM, HTB_TEXT_MAIN
-from ui.widgets.machine_card import MachineCard
+from ui.widgets.machine_card import AVATAR_SIZE, MachineCard
 from ui.widgets.modern_widgets import ModernButton
 from utils.debug import debug_log
-from utils.image_cache import get_cached_image, save_to_cache
+from utils.image_cache import DecodeImageTask, ImageSignals, cache_decoded, get_cached_image
 
 
 class MachinesWorker(QObject):
@@ -47,6 +46,15 @@ class MachinesPage(QWidget):
         self._network_manager = QNetworkAccessManager(self)
         self._network_manager.finished.connect(self._on_avatar_loaded)
         self._machine_cards: Dict[int, MachineCard] = {}  # machine_id -> card
+        self._avatar_pending: Dict[int, str] = {}  # machine_id -> avatar url not yet requested
+        self._avatar_inflight: Dict[str, Set[int]] = {}  # url -> machine_ids sharing it, until decoded
+        self._image_signals = ImageSignals(self)
+        self._image_signals.decoded.connect(self._on_avatar_decoded)
+        # Coalesces scroll/resize bursts into one visibility pass
+        self._avatar_timer = QTimer(self)
+        self._avatar_timer.setSingleShot(True)
+        self._avatar_timer.setInterval(50)
+        self._avatar_timer.timeout.connect(self._load_visible_avatars)
         self._zombie_threads: List[QThread] = [] # Prevent premature destruction
         self._setup_ui()
     
@@ -101,13 +109,15 @@ class MachinesPage(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setStyleSheet("background: transparent; border: none;")
+        scroll.setStyleSheet("QScrollArea, QScrollBar { background: transparent; border: none; }")
         self.grid_widget = QWidget()
         self.grid_layout = QGridLayout(self.grid_widget)
         self.grid_layout.setSpacing(14)
         self.grid_layout.setAlignment(Qt.AlignTop | Qt.AlignLeft)
         scroll.setWidget(self.grid_widget)
+        scroll.verticalScrollBar().valueChanged.connect(self._schedule_avatar_pass)
         layout.addWidget(scroll)
+        self._scroll = scroll
     
     def _force_reload(self):
         self._loaded = False
@@ -198,6 +208,7 @@ class MachinesPage(QWidget):
                 item.widget().deleteLater()
         
         self._machine_cards.clear()
+        self._avatar_pending.clear()
         self.count_label.setText(f"{len(machines)} machines")
         
         cols = max(1, (self.width() - 80) // 220)
@@ -208,33 +219,66 @@ class MachinesPage(QWidget):
             self.grid_layout.addWidget(card, i // cols, i % cols)
             self._machine_cards[m.id] = card
             
-            # Cargar avatar si tiene URL (usar caché)
+            # Avatar: from cache right away, otherwise once the card scrolls into view
             if m.avatar:
-                cached = get_cached_image(m.avatar)
+                cached = get_cached_image(m.avatar, AVATAR_SIZE)
                 if cached:
                     card.set_avatar_pixmap(cached)
+                elif m.avatar in self._avatar_inflight:
+                    self._avatar_inflight[m.avatar].add(m.id)
                 else:
-                    req = QNetworkRequest(QUrl(m.avatar))
-                    reply = self._network_manager.get(req)
-                    reply.setProperty("machine_id", m.id)
-                    reply.setProperty("url", m.avatar)
+                    self._avatar_pending[m.id] = m.avatar
+        
+        self._avatar_timer.start()
+    
+    def _schedule_avatar_pass(self, *_):
+        # Not wired straight to QTimer.start: valueChanged(int) would pick the start(msec) overload
+        self._avatar_timer.start()
+    
+    def _load_visible_avatars(self):
+        """Request avatars only for cards within (or a row away from) the viewport."""
+        if not self._avatar_pending or not self.isVisible():
+            return
+        viewport = self._scroll.viewport()
+        margin = 140  # roughly one card row of prefetch
+        visible = QRect(0, self._scroll.verticalScrollBar().value() - margin,
+                        self.grid_widget.width(), viewport.height() + 2 * margin)
+        for machine_id, url in list(self._avatar_pending.items()):
+            card = self._machine_cards.get(machine_id)
+            if card is None:
+                del self._avatar_pending[machine_id]
+            elif card.geometry().intersects(visible):
+                del self._avatar_pending[machine_id]
+                if url in self._avatar_inflight:
+                    self._avatar_inflight[url].add(machine_id)
+                    continue
+                self._avatar_inflight[url] = {machine_id}
+                reply = self._network_manager.get(QNetworkRequest(QUrl(url)))
+                reply.setProperty("url", url)
     
     @Slot(QNetworkReply)
     def _on_avatar_loaded(self, reply: QNetworkReply):
-        if reply.error() != QNetworkReply.NoError:
+        url = reply.property("url")
+        if reply.error() != QNetworkReply.NoError or not url:
+            self._avatar_inflight.pop(url, None)
             reply.deleteLater()
             return
-        machine_id = reply.property("machine_id")
-        url = reply.property("url")
-        if machine_id is not None and machine_id in self._machine_cards:
-            data = reply.readAll()
-            pixmap = save_to_cache(url, data) if url else None
-            if not pixmap:
-                pixmap = QPixmap()
-                pixmap.loadFromData(data)
-            if pixmap and not pixmap.isNull():
-                self._machine_cards[machine_id].set_avatar_pixmap(pixmap)
+        # Decode (and disk-cache) on the pool; the card is set in _on_avatar_decoded
+        data = bytes(reply.readAll())
         reply.deleteLater()
+        QThreadPool.globalInstance().start(DecodeImageTask(url, data, (AVATAR_SIZE,), self._image_signals))
+    
+    @Slot(str, object)
+    def _on_avatar_decoded(self, url: str, images: dict):
+        machine_ids = self._avatar_inflight.pop(url, ())
+        image = images.get(AVATAR_SIZE)
+        if image is None or image.isNull():
+            return
+        pixmap = cache_decoded(url, image, AVATAR_SIZE)
+        for machine_id in machine_ids:
+            card = self._machine_cards.get(machine_id)
+            if card is not None:
+                card.set_avatar_pixmap(pixmap)
     
     def resizeEvent(self, event):
         super().resizeEvent(event)
@@ -245,6 +289,7 @@ class MachinesPage(QWidget):
         super().showEvent(event)
         if not self._loaded and not self._loading:
             self.load_data()
+        self._avatar_timer.start()
     
     def hideEvent(self, event):
         super().hideEvent(event)
@@ -2,31 +2,48 @@
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QPushButton, QComboBox, QTableWidget, QTableWidgetItem,
+    QPushButton, QComboBox, QTableView,
     QFrame, QScrollArea, QHeaderView, QSizePolicy,
     QAbstractItemView,
 )
-from PySide6.QtCore import Qt, Signal, Slot, QThread, QObject, QUrl
-from PySide6.QtGui import QPixmap, QIcon, QPainter, QPainterPath
+from PySide6.QtCore import Qt, Signal, Slot, QObject, QUrl, QRunnable, QThreadPool
+from PySide6.QtGui import QPixmap, QImage, QIcon
 from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
-from typing import List, Optional
+import time
+from collections import deque
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
 
 from api.endpoints import HTBApi
 from models.season import Season, LeaderboardEntry
 from models.machine import Machine
 from ui.styles import HTB_GREEN, HTB_TEXT_DIM, HTB_BG_CARD
-from ui.widgets.machine_card import MachineCard
+from ui.widgets.machine_card import AVATAR_SIZE, MachineCard
+from ui.widgets.leaderboard_model import LeaderboardModel, avatar_url
 from utils.debug import debug_log
-from utils.image_cache import get_cached_image, save_to_cache
+from utils.image_cache import (
+    DecodeImageTask, ImageSignals, cache_decoded, get_cached_image, round_image
+)
+
+
+_SEASON_CACHE_TTL = 60.0  # seconds
+_LB_AVATAR_SIZE = 28
 
 
-class SeasonsWorker(QObject):
-    finished = Signal(dict)
-    error = Signal(str)
+class SeasonsSignals(QObject):
+    # (load id, payload) so the page can drop results from superseded loads
+    finished = Signal(int, dict)
+    error = Signal(int, str)
+
+
+class SeasonsTask(QRunnable):
+    """Fetches seasons, season machines and leaderboard on a pool thread."""
     
-    def __init__(self, season_id: Optional[int] = None):
+    def __init__(self, load_id: int, season_id: Optional[int], signals: SeasonsSignals):
         super().__init__()
+        self.load_id = load_id
         self.season_id = season_id
+        self.signals = signals
     
     def run(self):
         data = {}
@@ -65,9 +82,27 @@ class SeasonsWorker(QObject):
                 if success:
                     data["leaderboard"] = [LeaderboardEntry.from_api(e) for e in result.get("data", [])]
             
-            self.finished.emit(data)
+            self.signals.finished.emit(self.load_id, data)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(self.load_id, str(e))
+
+
+class AvatarSignals(QObject):
+    rounded = Signal(str, QImage)
+
+
+class RoundAvatarTask(QRunnable):
+    """Rounds a leaderboard avatar on a pool thread."""
+    
+    def __init__(self, url: str, image: QImage, size: int, signals: AvatarSignals):
+        super().__init__()
+        self.url = url
+        self.image = image
+        self.size = size
+        self.signals = signals
+    
+    def run(self):
+        self.signals.rounded.emit(self.url, round_image(self.image, self.size))
 
 
 class SeasonsPage(QWidget):
@@ -77,16 +112,28 @@ class SeasonsPage(QWidget):
         super().__init__(parent)
         self._seasons: List[Season] = []
         self._current: Optional[Season] = None
-        self._thread = None
-        self._worker = None
+        self._signals = SeasonsSignals(self)
+        self._signals.finished.connect(self._on_task_finished)
+        self._signals.error.connect(self._on_task_error)
+        self._load_id = 0
+        # season id -> last loaded payload, and when it was loaded
+        self._season_cache: Dict[int, dict] = {}
+        self._season_cache_time: Dict[int, float] = {}
         self._loading = False
         self._loaded = False
         self._network_manager = QNetworkAccessManager(self)
-        self._network_manager.finished.connect(self._on_leaderboard_avatar_loaded)
-        self._machine_avatar_network = QNetworkAccessManager(self)
-        self._machine_avatar_network.finished.connect(self._on_machine_avatar_loaded)
+        self._network_manager.finished.connect(self._on_avatar_reply)
         self._machine_cards = {}
-        self._zombie_threads: List[QThread] = []
+        self._avatar_signals = AvatarSignals(self)
+        self._avatar_signals.rounded.connect(self._on_avatar_rounded)
+        self._image_signals = ImageSignals(self)
+        self._image_signals.decoded.connect(self._on_avatar_decoded)
+        # url -> (decode size, callback) pairs waiting on the in-flight download of that url
+        self._pending_urls: Dict[str, List[Tuple[int, Callable[[QPixmap], None]]]] = {}
+        # Bounded avatar download queue: (request, url)
+        self._avatar_queue: deque = deque()
+        self._inflight = 0
+        self._max_inflight = 6
         self._setup_ui()
     
     def _setup_ui(self):
@@ -139,10 +186,9 @@ class SeasonsPage(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFixedHeight(150)
-        scroll.setStyleSheet("background: transparent; border: none;")
+        scroll.setStyleSheet("QScrollArea, QScrollBar { background: transparent; border: none; }")
         scroll.setFrameShape(QFrame.NoFrame)
         self.machines_widget = QWidget()
-        self.machines_widget.setStyleSheet("background: transparent;")
         self.machines_layout = QHBoxLayout(self.machines_widget)
         self.machines_layout.setAlignment(Qt.AlignLeft)
         self.machines_layout.setSpacing(16)
@@ -154,70 +200,70 @@ class SeasonsPage(QWidget):
         lb_label.setStyleSheet(f"color: {HTB_TEXT_DIM}; font-size: 11px; font-weight: 700; letter-spacing: 1.5px;")
         layout.addWidget(lb_label)
         
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Rank", "Player", "Points", "Owns"])
+        self._lb_model = LeaderboardModel(self)
+        self.table = QTableView()
+        self.table.setModel(self._lb_model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.table.verticalHeader().setVisible(False)
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.setStyleSheet(f"background-color: {HTB_BG_CARD}; border-radius: 8px;")
         layout.addWidget(self.table)
     
-    def _safe_cleanup_thread(self, thread: QThread, worker: QObject):
-        if not thread: return
-        if worker:
-            try: worker.disconnect()
-            except: pass
-        if thread.isRunning():
-            self._zombie_threads.append(thread)
-            thread.finished.connect(lambda t=thread: self._on_zombie_finished(t))
-            thread.quit()
-        else:
-            thread.deleteLater()
-            if worker: worker.deleteLater()
-
-    def _on_zombie_finished(self, thread: QThread):
-        if thread in self._zombie_threads:
-            self._zombie_threads.remove(thread)
-        thread.deleteLater()
-
-    def _cleanup_thread(self):
-        self._safe_cleanup_thread(self._thread, self._worker)
-        self._thread = None
-        self._worker = None
+    def _cancel_load(self):
+        """Forget any in-flight load; its results will be ignored."""
+        self._load_id += 1
+        self._loading = False
 
     def stop_background_tasks(self):
-        """Llamado al cerrar la app para evitar QThread destroyed while running."""
-        self._loading = False
-        self._cleanup_thread()
+        """Llamado al cerrar la app para descartar resultados pendientes."""
+        self._cancel_load()
 
     def load_data(self, season_id: Optional[int] = None):
         if self._loading:
             return
-        self._loading = True
-        self._cleanup_thread()
         sid = season_id or (self._current.id if self._current else None)
-        self._thread = QThread()
-        self._worker = SeasonsWorker(sid)
-        self._worker.moveToThread(self._thread)
-        self._thread.started.connect(self._worker.run)
-        self._worker.finished.connect(self._on_loaded)
-        self._worker.error.connect(self._on_error)
-        self._thread.start()
+        cached = self._season_cache.get(sid)
+        if cached and time.monotonic() - self._season_cache_time[sid] < _SEASON_CACHE_TTL:
+            self._on_loaded(cached)
+            return
+        self._loading = True
+        self._load_id += 1
+        QThreadPool.globalInstance().start(SeasonsTask(self._load_id, sid, self._signals))
+
+    @Slot(int, dict)
+    def _on_task_finished(self, load_id: int, data: dict):
+        if load_id == self._load_id:
+            self._on_loaded(data)
+
+    @Slot(int, str)
+    def _on_task_error(self, load_id: int, error: str):
+        if load_id == self._load_id:
+            self._on_error(error)
     
     @Slot(dict)
     def _on_loaded(self, data: dict):
         self._loading = False
         self._loaded = True
-        self._cleanup_thread()
+        if "active" in data:
+            sid = data["active"].id
+            if self._season_cache.get(sid) is not data:
+                self._season_cache[sid] = data
+                self._season_cache_time[sid] = time.monotonic()
         
         if "seasons" in data:
             self._seasons = data["seasons"]
-            self.season_combo.blockSignals(True)
-            self.season_combo.clear()
-            for s in self._seasons:
-                self.season_combo.addItem(f"{'🟢' if s.active else '⚪'} {s.name}", s.id)
-            self.season_combo.blockSignals(False)
+            items = [(f"{'🟢' if s.active else '⚪'} {s.name}", s.id) for s in self._seasons]
+            combo = self.season_combo
+            current = [(combo.itemText(i), combo.itemData(i)) for i in range(combo.count())]
+            if items != current:
+                view = combo.view()
+                combo.blockSignals(True)
+                view.setUpdatesEnabled(False)
+                combo.clear()
+                for label, sid in items:
+                    combo.addItem(label, sid)
+                view.setUpdatesEnabled(True)
+                combo.blockSignals(False)
         
         if "active" in data:
             s = data["active"]
@@ -237,97 +283,91 @@ class SeasonsPage(QWidget):
                 self.machines_layout.addWidget(card)
                 self._machine_cards[m.id] = card
                 if m.avatar:
-                    cached = get_cached_image(m.avatar)
-                    if cached:
-                        card.set_avatar_pixmap(cached)
-                    else:
-                        req = QNetworkRequest(QUrl(m.avatar))
-                        reply = self._machine_avatar_network.get(req)
-                        reply.setProperty("machine_id", m.id)
-                        reply.setProperty("url", m.avatar)
+                    self._request_avatar(m.avatar, partial(self._on_machine_avatar_loaded, m.id), AVATAR_SIZE)
         
         if "leaderboard" in data:
             entries = data["leaderboard"]
-            self.table.setRowCount(len(entries))
-            for i, e in enumerate(entries):
-                self.table.setItem(i, 0, QTableWidgetItem(f"#{e.rank}"))
-                player_item = QTableWidgetItem(e.name)
-                self.table.setItem(i, 1, player_item)
-                if e.avatar_thumb:
-                    url = e.avatar_thumb if e.avatar_thumb.startswith("http") else f"https://labs.hackthebox.com{e.avatar_thumb}"
-                    cached = get_cached_image(url)
-                    if cached:
-                        size = 28
-                        rounded = QPixmap(size, size)
-                        rounded.fill(Qt.transparent)
-                        painter = QPainter(rounded)
-                        painter.setRenderHint(QPainter.Antialiasing)
-                        path = QPainterPath()
-                        path.addEllipse(0, 0, size, size)
-                        painter.setClipPath(path)
-                        painter.drawPixmap(0, 0, size, size, cached.scaled(size, size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation))
-                        painter.end()
-                        player_item.setIcon(QIcon(rounded))
-                    else:
-                        req = QNetworkRequest(QUrl(url))
-                        reply = self._network_manager.get(req)
-                        reply.setProperty("row", i)
-                        reply.setProperty("col", 1)
-                        reply.setProperty("url", url)
-                self.table.setItem(i, 2, QTableWidgetItem(str(e.points)))
-                self.table.setItem(i, 3, QTableWidgetItem(f"{e.user_owns}/{e.root_owns}"))
+            self._lb_model.update(entries)
+            for url in dict.fromkeys(avatar_url(e) for e in entries):
+                if url and not self._lb_model.has_avatar(url):
+                    self._request_avatar(
+                        url, partial(self._on_leaderboard_avatar_loaded, url), _LB_AVATAR_SIZE
+                    )
 
-    @Slot(QNetworkReply)
-    def _on_machine_avatar_loaded(self, reply: QNetworkReply):
-        if reply.error() != QNetworkReply.NoError:
-            reply.deleteLater()
+    def _request_avatar(self, url: str, on_pixmap: Callable[[QPixmap], None], decode_size: int = 0):
+        """
+        Deliver the avatar for url to on_pixmap, sharing in-flight downloads.
+        
+        A non-zero decode_size asks for a downscaled decode, cached at that size.
+        """
+        cached = get_cached_image(url, decode_size)
+        if cached:
+            on_pixmap(cached)
             return
-        machine_id = reply.property("machine_id")
-        url = reply.property("url")
-        if machine_id is not None and machine_id in self._machine_cards:
-            img_data = reply.readAll()
-            pixmap = save_to_cache(url, img_data) if url else None
-            if not pixmap:
-                pixmap = QPixmap()
-                pixmap.loadFromData(img_data)
-            if pixmap and not pixmap.isNull():
-                self._machine_cards[machine_id].set_avatar_pixmap(pixmap)
-        reply.deleteLater()
-    
+        callbacks = self._pending_urls.get(url)
+        if callbacks is not None:
+            callbacks.append((decode_size, on_pixmap))
+            return
+        self._pending_urls[url] = [(decode_size, on_pixmap)]
+        self._submit_avatar(QNetworkRequest(QUrl(url)), url)
+
+    def _submit_avatar(self, req: QNetworkRequest, url: str):
+        """Start an avatar download, or queue it if too many are in flight."""
+        if self._inflight >= self._max_inflight:
+            self._avatar_queue.append((req, url))
+            return
+        self._inflight += 1
+        reply = self._network_manager.get(req)
+        reply.setProperty("url", url)
+
+    def _avatar_done(self):
+        """Release an in-flight slot and start the next queued download."""
+        self._inflight = max(0, self._inflight - 1)
+        if self._avatar_queue:
+            self._submit_avatar(*self._avatar_queue.popleft())
+
     @Slot(QNetworkReply)
-    def _on_leaderboard_avatar_loaded(self, reply: QNetworkReply):
+    def _on_avatar_reply(self, reply: QNetworkReply):
+        self._avatar_done()
+        url = reply.property("url")
         if reply.error() != QNetworkReply.NoError:
+            self._pending_urls.pop(url, None)
             reply.deleteLater()
             return
-        row = reply.property("row")
-        col = reply.property("col")
-        url = reply.property("url")
-        if row is not None and col is not None and row < self.table.rowCount():
-            item = self.table.item(row, col)
-            if item:
-                img_data = reply.readAll()
-                pixmap = save_to_cache(url, img_data) if url else None
-                if not pixmap:
-                    pixmap = QPixmap()
-                    pixmap.loadFromData(img_data)
-                if pixmap and not pixmap.isNull():
-                    size = 28
-                    rounded = QPixmap(size, size)
-                    rounded.fill(Qt.transparent)
-                    painter = QPainter(rounded)
-                    painter.setRenderHint(QPainter.Antialiasing)
-                    path = QPainterPath()
-                    path.addEllipse(0, 0, size, size)
-                    painter.setClipPath(path)
-                    painter.drawPixmap(0, 0, size, size, pixmap.scaled(size, size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation))
-                    painter.end()
-                    item.setIcon(QIcon(rounded))
+        # Callbacks stay pending (so repeats keep sharing) until the pool decode lands
+        sizes = dict.fromkeys(size for size, _ in self._pending_urls.get(url, []))
+        data = bytes(reply.readAll())
         reply.deleteLater()
+        QThreadPool.globalInstance().start(DecodeImageTask(url, data, sizes, self._image_signals))
+
+    @Slot(str, object)
+    def _on_avatar_decoded(self, url: str, images: dict):
+        callbacks = self._pending_urls.pop(url, [])
+        pixmaps: Dict[int, QPixmap] = {}
+        for size, image in images.items():
+            pixmaps[size] = cache_decoded(url, image, size)
+        for size, on_pixmap in callbacks:
+            # A caller that joined mid-decode may want a size that wasn't decoded
+            pixmap = pixmaps.get(size) or next(iter(pixmaps.values()), None)
+            if pixmap and not pixmap.isNull():
+                on_pixmap(pixmap)
+
+    def _on_machine_avatar_loaded(self, machine_id: int, pixmap: QPixmap):
+        card = self._machine_cards.get(machine_id)
+        if card:
+            card.set_avatar_pixmap(pixmap)
+    
+    def _on_leaderboard_avatar_loaded(self, url: str, pixmap: QPixmap):
+        task = RoundAvatarTask(url, pixmap.toImage(), _LB_AVATAR_SIZE, self._avatar_signals)
+        QThreadPool.globalInstance().start(task)
+
+    @Slot(str, QImage)
+    def _on_avatar_rounded(self, url: str, image: QImage):
+        self._lb_model.set_avatar(url, QIcon(QPixmap.fromImage(image)))
 
     @Slot(str)
     def _on_error(self, error: str):
         self._loading = False
-        self._cleanup_thread()
     
     def _on_season_changed(self, index: int):
         if index < 0 or not self._seasons or self._loading:
@@ -343,4 +383,4 @@ class SeasonsPage(QWidget):
     
     def hideEvent(self, event):
         super().hideEvent(event)
-        self._cleanup_thread()
+        self._cancel_load()
@@ -10,6 +10,7 @@ from config import config
 from api.endpoints import HTBApi
 from ui.styles import HTB_GREEN, HTB_BG_CARD, HTB_BG_MAIN, HTB_TEXT_DIM, BTN_PRIMARY, BTN_DEFAULT
 from ui.widgets.modern_widgets import ModernButton
+from utils import http_cache
 from utils.debug import debug_log
 
 
@@ -36,7 +37,7 @@ class SettingsPage(QWidget):
         layout.addWidget(section1)
         
         token_frame = QFrame()
-        token_frame.setStyleSheet(f"background-color: {HTB_BG_MAIN}; border-radius: 12px;")
+        token_frame.setStyleSheet(f"QFrame, QLineEdit, QCheckBox {{ background-color: {HTB_BG_MAIN}; border-radius: 12px; }}")
         token_frame.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
         
         token_layout = QVBoxLayout(token_frame)
@@ -96,13 +97,38 @@ class SettingsPage(QWidget):
         
         layout.addWidget(token_frame)
         
+        # Interface
+        section_ui = QLabel("INTERFACE")
+        section_ui.setStyleSheet(f"color: {HTB_TEXT_DIM}; font-size: 11px; font-weight: 700; letter-spacing: 1.5px;")
+        layout.addWidget(section_ui)
+        
+        ui_frame = QFrame()
+        ui_frame.setStyleSheet(f"QFrame, QLineEdit, QCheckBox {{ background-color: {HTB_BG_MAIN}; border-radius: 12px; }}")
+        ui_frame.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
+        
+        ui_layout = QVBoxLayout(ui_frame)
+        ui_layout.setContentsMargins(24, 20, 24, 20)
+        ui_layout.setSpacing(12)
+        
+        self.motion_check = QCheckBox("Reduce motion")
+        self.motion_check.setChecked(config.reduced_motion)
+        self.motion_check.toggled.connect(self._toggle_reduced_motion)
+        ui_layout.addWidget(self.motion_check)
+        
+        motion_info = QLabel("Switch pages instantly instead of fading them in.")
+        motion_info.setStyleSheet(f"color: {HTB_TEXT_DIM}; font-size: 13px;")
+        motion_info.setWordWrap(True)
+        ui_layout.addWidget(motion_info)
+        
+        layout.addWidget(ui_frame)
+        
         # Debug
         section2 = QLabel("DEBUG")
         section2.setStyleSheet(f"color: {HTB_TEXT_DIM}; font-size: 11px; font-weight: 700; letter-spacing: 1.5px;")
         layout.addWidget(section2)
         
         debug_frame = QFrame()
-        debug_frame.setStyleSheet(f"background-color: {HTB_BG_MAIN}; border-radius: 12px;")
+        debug_frame.setStyleSheet(f"QFrame, QLineEdit, QCheckBox {{ background-color: {HTB_BG_MAIN}; border-radius: 12px; }}")
         debug_frame.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
         
         debug_layout = QVBoxLayout(debug_frame)
@@ -127,7 +153,7 @@ class SettingsPage(QWidget):
         layout.addWidget(section3)
         
         about_frame = QFrame()
-        about_frame.setStyleSheet(f"background-color: {HTB_BG_MAIN}; border-radius: 12px;")
+        about_frame.setStyleSheet(f"QFrame, QLineEdit, QCheckBox {{ background-color: {HTB_BG_MAIN}; border-radius: 12px; }}")
         about_frame.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
         
         about_layout = QVBoxLayout(about_frame)
@@ -152,6 +178,8 @@ class SettingsPage(QWidget):
             QMessageBox.warning(self, "Error", "Please enter a token")
             return
         
+        if token != config.api_token:
+            http_cache.clear_cache()  # drop the previous account's responses
         config.api_token = token
         self.status_label.setText("✓ Token saved successfully!")
         self.status_label.setStyleSheet(f"color: {HTB_GREEN}; font-size: 13px;")
@@ -171,6 +199,10 @@ class SettingsPage(QWidget):
             self.status_label.setText(f"✗ Connection failed: {result}")
             self.status_label.setStyleSheet("color: #fc4747; font-size: 13px;")
     
+    def _toggle_reduced_motion(self, enabled: bool):
+        config.reduced_motion = enabled
+        debug_log("SETTINGS", f"Reduced motion: {enabled}")
+    
     def _toggle_debug(self, enabled: bool):
         config.debug = enabled
         debug_log("SETTINGS", f"Debug mode: {enabled}")
@@ -1,44 +1,217 @@
 """Toolkit Page - CyberChef-style Hacker Toolbox."""
 
 import base64
+import codecs
 import hashlib
 import html
-import json
-import subprocess
+import re
+import socket
+import struct
+import time
 import urllib.parse
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTextEdit,
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPlainTextEdit,
     QComboBox, QLineEdit, QFrame, QScrollArea, QPushButton,
-    QGridLayout, QApplication, QSizePolicy
+    QGridLayout, QApplication, QSizePolicy, QStackedWidget
 )
 from PySide6.QtCore import Qt, QTimer, Slot
+from PySide6.QtGui import QIntValidator, QTextCursor
 
 from ui.styles import (
     HTB_GREEN, HTB_BG_CARD, HTB_BG_MAIN, HTB_BG_HOVER,
     HTB_TEXT_MAIN, HTB_TEXT_SEC, HTB_TEXT_DIM, HTB_BORDER,
-    HTB_BG_DARKEST, HTB_BG_INPUT, FONT_FAMILY_MAIN
+    HTB_BG_DARKEST, HTB_BG_INPUT
 )
 from ui.widgets.modern_widgets import ModernButton
+from utils import fastjson
 from utils.debug import debug_log
 
 
-def _get_tun0_ip() -> Optional[str]:
-    """Get tun0 interface IP address."""
+_SIOCGIFADDR = 0x8915
+_TUN0_TTL = 2.0  # seconds
+_tun0_cache: tuple[float, Optional[str]] = (float("-inf"), None)
+
+
+def _read_tun0_ip() -> Optional[str]:
+    """Read tun0's IPv4 address in-process via SIOCGIFADDR."""
+    if fcntl is None:
+        return None
     try:
-        out = subprocess.check_output(
-            ["ip", "-4", "addr", "show", "tun0"],
-            stderr=subprocess.DEVNULL, timeout=2
-        ).decode()
-        for line in out.splitlines():
-            line = line.strip()
-            if line.startswith("inet "):
-                return line.split()[1].split("/")[0]
-    except Exception:
-        pass
-    return None
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            ifreq = struct.pack("256s", b"tun0")
+            addr = fcntl.ioctl(sock.fileno(), _SIOCGIFADDR, ifreq)
+            return socket.inet_ntoa(addr[20:24])
+    except OSError:
+        return None
+
+
+def _get_tun0_ip() -> Optional[str]:
+    """Get tun0 interface IP address (re-read at most every 2 s)."""
+    global _tun0_cache
+    now = time.monotonic()
+    ts, ip = _tun0_cache
+    if now - ts < _TUN0_TTL:
+        return ip
+    ip = _read_tun0_ip()
+    _tun0_cache = (now, ip)
+    return ip
+
+
+# ============================================================
+# STYLES — one sheet for the whole page, parsed once
+# ============================================================
+
+_MONO = "'JetBrains Mono', 'Fira Code', 'Consolas', monospace"
+
+_TOOLKIT_QSS = f"""
+QLabel#pageTitle {{
+    font-size: 28px;
+    font-weight: 700;
+    letter-spacing: -0.5px;
+}}
+QLabel[role="section"] {{
+    color: {HTB_TEXT_DIM};
+    font-size: 11px;
+    font-weight: 700;
+    letter-spacing: 1.5px;
+}}
+QPushButton[role="tab"] {{
+    background-color: transparent;
+    border: 1px solid transparent;  /* same box as the active state */
+    border-radius: 8px;
+    color: {HTB_TEXT_SEC};
+    font-weight: 600;
+    font-size: 13px;
+    padding: 0 20px;
+}}
+QPushButton[role="tab"]:hover {{
+    background-color: {HTB_BG_HOVER};
+    color: {HTB_TEXT_MAIN};
+}}
+QPushButton[role="tab"][active="true"] {{
+    background-color: {HTB_BG_HOVER};
+    color: {HTB_GREEN};
+    border: 1px solid {HTB_BORDER};
+}}
+QScrollArea#toolkitScroll {{
+    border: none;
+    background-color: transparent;
+}}
+QScrollBar:vertical {{
+    background: {HTB_BG_DARKEST};
+    width: 8px;
+    border-radius: 4px;
+}}
+QScrollBar::handle:vertical {{
+    background: {HTB_BG_HOVER};
+    border-radius: 4px;
+    min-height: 20px;
+}}
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+    height: 0;
+}}
+QPlainTextEdit#encInput, QPlainTextEdit#encOutput {{
+    background-color: {HTB_BG_MAIN};
+    border: 1px solid {HTB_BORDER};
+    border-radius: 8px;
+    color: {HTB_TEXT_MAIN};
+    font-family: {_MONO};
+    font-size: 13px;
+    padding: 10px;
+}}
+QPlainTextEdit#encOutput {{
+    color: {HTB_GREEN};
+}}
+QFrame[role="paramBar"] {{
+    background-color: {HTB_BG_MAIN};
+    border-radius: 10px;
+}}
+QLabel[role="paramLabel"] {{
+    color: {HTB_TEXT_DIM};
+    font-size: 11px;
+    font-weight: 700;
+    letter-spacing: 1px;
+    border: none;
+}}
+QLineEdit[role="param"], QLineEdit[role="paramSmall"] {{
+    background-color: {HTB_BG_DARKEST};
+    border: 1px solid {HTB_BORDER};
+    border-radius: 6px;
+    color: {HTB_GREEN};
+    font-family: 'JetBrains Mono', monospace;
+    font-size: 13px;
+    padding: 6px 10px;
+}}
+QLineEdit[role="paramSmall"] {{
+    padding: 5px 8px;
+}}
+QLabel#tun0Status {{
+    color: {HTB_TEXT_DIM};
+    font-size: 11px;
+    border: none;
+}}
+QLabel#tun0Status[up="true"] {{
+    color: {HTB_GREEN};
+}}
+QLabel#listenerLabel {{
+    color: {HTB_TEXT_DIM};
+    font-size: 11px;
+    font-weight: 600;
+    border: none;
+}}
+QLabel#listenerCmd {{
+    color: {HTB_TEXT_SEC};
+    font-family: 'JetBrains Mono', monospace;
+    font-size: 12px;
+    background-color: {HTB_BG_DARKEST};
+    border: 1px solid {HTB_BORDER};
+    border-radius: 4px;
+    padding: 4px 8px;
+}}
+QFrame#snippetFrame {{
+    background-color: {HTB_BG_MAIN};
+    border: 1px solid {HTB_BORDER};
+    border-radius: 8px;
+}}
+QLabel#snippetTitle {{
+    color: {HTB_GREEN};
+    font-size: 11px;
+    font-weight: 700;
+    background: transparent;
+    border: none;
+}}
+QPushButton#snippetCopy {{
+    background-color: {HTB_BG_HOVER};
+    border: 1px solid {HTB_BORDER};
+    border-radius: 4px;
+    color: {HTB_TEXT_SEC};
+    font-size: 10px;
+    font-weight: normal;
+    padding: 2px 8px;
+}}
+QPushButton#snippetCopy:hover {{
+    background-color: {HTB_BG_CARD};
+    color: {HTB_TEXT_MAIN};
+}}
+QLabel#snippetCode {{
+    background-color: {HTB_BG_DARKEST};
+    color: {HTB_TEXT_SEC};
+    font-family: {_MONO};
+    font-size: 11px;
+    border: 1px solid {HTB_BORDER};
+    border-radius: 4px;
+    padding: 8px;
+}}
+"""
 
 
 # ============================================================
@@ -52,8 +225,8 @@ _PAYLOADS_FILE = _DATA_DIR / "payloads.json"
 def _load_payloads():
     """Load payloads from JSON config file."""
     try:
-        with open(_PAYLOADS_FILE, "r") as f:
-            data = json.load(f)
+        with open(_PAYLOADS_FILE, "rb") as f:
+            data = fastjson.loads(f.read())
         shells = data.get("reverse_shells", [])
         payloads = {}
         for cat, items in data.get("quick_payloads", {}).items():
@@ -85,39 +258,43 @@ ENCODING_OPS = [
 ]
 
 
+_HASH_CHUNK = 64 * 1024
+
+
+def _hash_text(text: str, algo: str) -> str:
+    """Hex digest of text, fed to hashlib in 64 KB chunks."""
+    h = hashlib.new(algo)
+    mv = memoryview(text.encode())
+    for i in range(0, len(mv), _HASH_CHUNK):
+        h.update(mv[i:i + _HASH_CHUNK])
+    return h.hexdigest()
+
+
+_ENC_OPS: dict[str, Callable[[str], str]] = {
+    "URL Encode": urllib.parse.quote,
+    "URL Decode": urllib.parse.unquote,
+    "Double URL Encode": lambda t: urllib.parse.quote(urllib.parse.quote(t)),
+    "Base64 Encode": lambda t: base64.b64encode(t.encode()).decode(),
+    "Base64 Decode": lambda t: base64.b64decode(t.encode()).decode(),
+    "HTML Encode": html.escape,
+    "HTML Decode": html.unescape,
+    "Hex Encode": lambda t: t.encode().hex(),
+    "Hex Decode": lambda t: bytes.fromhex(t).decode(),
+    "ROT13": lambda t: codecs.encode(t, "rot_13"),
+    "MD5 Hash": lambda t: _hash_text(t, "md5"),
+    "SHA1 Hash": lambda t: _hash_text(t, "sha1"),
+    "SHA256 Hash": lambda t: _hash_text(t, "sha256"),
+    "Unicode Escape": lambda t: t.encode("unicode_escape").decode(),
+}
+
+
 def _apply_encoding(op: str, text: str) -> str:
     """Apply encoding/decoding operation."""
-    try:
-        if op == "URL Encode":
-            return urllib.parse.quote(text)
-        elif op == "URL Decode":
-            return urllib.parse.unquote(text)
-        elif op == "Double URL Encode":
-            return urllib.parse.quote(urllib.parse.quote(text))
-        elif op == "Base64 Encode":
-            return base64.b64encode(text.encode()).decode()
-        elif op == "Base64 Decode":
-            return base64.b64decode(text.encode()).decode()
-        elif op == "HTML Encode":
-            return html.escape(text)
-        elif op == "HTML Decode":
-            return html.unescape(text)
-        elif op == "Hex Encode":
-            return text.encode().hex()
-        elif op == "Hex Decode":
-            return bytes.fromhex(text).decode()
-        elif op == "ROT13":
-            import codecs
-            return codecs.encode(text, "rot_13")
-        elif op == "MD5 Hash":
-            return hashlib.md5(text.encode()).hexdigest()
-        elif op == "SHA1 Hash":
-            return hashlib.sha1(text.encode()).hexdigest()
-        elif op == "SHA256 Hash":
-            return hashlib.sha256(text.encode()).hexdigest()
-        elif op == "Unicode Escape":
-            return text.encode("unicode_escape").decode()
+    fn = _ENC_OPS.get(op)
+    if fn is None:
         return text
+    try:
+        return fn(text)
     except Exception as e:
         return f"Error: {e}"
 
@@ -144,12 +321,34 @@ class _CopyButton(ModernButton):
         self.setText(self._original)
 
 
+class _SnippetCopyButton(_CopyButton):
+    """Compact copy button styled by the page sheet (#snippetCopy)."""
+
+    def __init__(self, text="📋 Copy", parent=None):
+        super().__init__(text, parent)
+        self.setObjectName("snippetCopy")
+
+
+_PLACEHOLDER_RE = re.compile(r"\{(IP|PORT)\}")
+
+
+@lru_cache(maxsize=None)
+def _split_template(template: str) -> tuple[str, ...]:
+    """
+    Split a snippet template around its placeholders.
+    
+    Even indices are literal text, odd indices are placeholder names
+    ("IP" / "PORT"), so rendering is a single join.
+    """
+    return tuple(_PLACEHOLDER_RE.split(template))
+
+
 class _CodeSnippet(QWidget):
     """A compact code snippet with title and copy button. Used for both payloads and shells."""
 
     def __init__(self, title: str, code_template: str, ip: str = "", port: str = "4444", parent=None):
         super().__init__(parent)
-        self._template = code_template
+        self._parts = _split_template(code_template)
         self._ip = ip
         self._port = port
 
@@ -160,13 +359,6 @@ class _CodeSnippet(QWidget):
         # Container frame
         frame = QFrame()
         frame.setObjectName("snippetFrame")
-        frame.setStyleSheet(f"""
-            QFrame#snippetFrame {{
-                background-color: {HTB_BG_MAIN};
-                border: 1px solid {HTB_BORDER};
-                border-radius: 8px;
-            }}
-        """)
         frame_layout = QVBoxLayout(frame)
         frame_layout.setContentsMargins(12, 8, 12, 8)
         frame_layout.setSpacing(6)
@@ -176,26 +368,12 @@ class _CodeSnippet(QWidget):
         hdr.setContentsMargins(0, 0, 0, 0)
         title_lbl = QLabel(title)
         title_lbl.setTextFormat(Qt.PlainText)
-        title_lbl.setStyleSheet(f"color: {HTB_GREEN}; font-size: 11px; font-weight: 700; background: transparent; border: none;")
+        title_lbl.setObjectName("snippetTitle")
         hdr.addWidget(title_lbl)
         hdr.addStretch()
 
-        self._copy_btn = _CopyButton("📋 Copy", self)
+        self._copy_btn = _SnippetCopyButton("📋 Copy", self)
         self._copy_btn.setFixedHeight(22)
-        self._copy_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {HTB_BG_HOVER};
-                border: 1px solid {HTB_BORDER};
-                border-radius: 4px;
-                color: {HTB_TEXT_SEC};
-                font-size: 10px;
-                padding: 2px 8px;
-            }}
-            QPushButton:hover {{
-                background-color: {HTB_BG_CARD};
-                color: {HTB_TEXT_MAIN};
-            }}
-        """)
         self._copy_btn.clicked.connect(self._do_copy)
         hdr.addWidget(self._copy_btn)
         frame_layout.addLayout(hdr)
@@ -205,27 +383,24 @@ class _CodeSnippet(QWidget):
         self._code_lbl.setTextFormat(Qt.PlainText)
         self._code_lbl.setWordWrap(True)
         self._code_lbl.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        self._code_lbl.setStyleSheet(f"""
-            background-color: {HTB_BG_DARKEST};
-            color: {HTB_TEXT_SEC};
-            font-family: 'JetBrains Mono', 'Fira Code', 'Consolas', monospace;
-            font-size: 11px;
-            border: 1px solid {HTB_BORDER};
-            border-radius: 4px;
-            padding: 8px;
-        """)
+        self._code_lbl.setObjectName("snippetCode")
         self._update_code()
         frame_layout.addWidget(self._code_lbl)
 
         layout.addWidget(frame)
 
     def _render(self) -> str:
-        return self._template.replace("{IP}", self._ip).replace("{PORT}", self._port)
+        values = {"IP": self._ip, "PORT": self._port}
+        return "".join(
+            values[part] if i % 2 else part for i, part in enumerate(self._parts)
+        )
 
     def _update_code(self):
         self._code_lbl.setText(self._render())
 
     def update_params(self, ip: str, port: str):
+        if ip == self._ip and port == self._port:
+            return  # label already shows this render
         self._ip = ip
         self._port = port
         self._update_code()
@@ -245,36 +420,33 @@ class _TabButton(QPushButton):
     def __init__(self, text: str, tab_id: str, parent=None):
         super().__init__(text, parent)
         self.tab_id = tab_id
-        self.setCheckable(True)
         self.setCursor(Qt.PointingHandCursor)
         self.setFixedHeight(36)
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                border-radius: 8px;
-                color: {HTB_TEXT_SEC};
-                font-family: {FONT_FAMILY_MAIN};
-                font-weight: 600;
-                font-size: 13px;
-                padding: 0 20px;
-            }}
-            QPushButton:hover {{
-                background-color: {HTB_BG_HOVER};
-                color: {HTB_TEXT_MAIN};
-            }}
-            QPushButton:checked {{
-                background-color: {HTB_BG_HOVER};
-                color: {HTB_GREEN};
-                border: 1px solid {HTB_BORDER};
-            }}
-        """)
+        self.setProperty("role", "tab")
+        self.setProperty("active", False)
+
+    def set_active(self, active: bool):
+        """Flip the [active] style property, repolishing only on a real change."""
+        if self.property("active") == active:
+            return
+        self.setProperty("active", active)
+        self.style().unpolish(self)
+        self.style().polish(self)
 
 
 # ============================================================
 # MAIN PAGE
 # ============================================================
 
+def _is_port_text(text: str) -> bool:
+    """True for "" (falls back to 4444) or plain ASCII digits."""
+    return not text or (text.isascii() and text.isdigit())
+
+
+# QTextCursor.selectedText() -> toPlainText() equivalents
+_PLAIN_TEXT_MAP = str.maketrans({"\u2029": "\n", "\u2028": "\n", "\u00a0": " "})
+
+
 class ToolkitPage(QWidget):
     """CyberChef-style Hacker Toolkit."""
 
@@ -284,6 +456,17 @@ class ToolkitPage(QWidget):
         self._payload_cards: list[_PayloadCard] = []
         self._ip = _get_tun0_ip() or "10.10.14.1"
         self._port = "4444"
+        self._last_enc_result: Optional[str] = None
+        # (op, text, result) of the last encode only, so big pastes aren't pinned
+        self._enc_memo: Optional[tuple[str, str, str]] = None
+        # IP/port edits are coalesced so a typing burst re-renders the cards once
+        self._params_timer = QTimer(self)
+        self._params_timer.setSingleShot(True)
+        self._params_timer.timeout.connect(self._flush_params)
+        self._pay_params_timer = QTimer(self)
+        self._pay_params_timer.setSingleShot(True)
+        self._pay_params_timer.timeout.connect(self._flush_payload_params)
+        self.setStyleSheet(_TOOLKIT_QSS)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -293,7 +476,7 @@ class ToolkitPage(QWidget):
 
         # Header
         title = QLabel("Toolkit")
-        title.setStyleSheet("font-size: 28px; font-weight: 700; letter-spacing: -0.5px;")
+        title.setObjectName("pageTitle")
         layout.addWidget(title)
 
         # Tab Bar
@@ -308,7 +491,7 @@ class ToolkitPage(QWidget):
         ]
         for tid, label in tabs:
             btn = _TabButton(label, tid)
-            btn.clicked.connect(lambda checked, t=tid: self._switch_tab(t))
+            btn.clicked.connect(self._on_tab_clicked)
             tab_bar.addWidget(btn)
             self._tab_btns[tid] = btn
 
@@ -318,31 +501,19 @@ class ToolkitPage(QWidget):
         # Content area (scroll)
         self._content_scroll = QScrollArea()
         self._content_scroll.setWidgetResizable(True)
-        self._content_scroll.setStyleSheet(f"""
-            QScrollArea {{
-                border: none;
-                background-color: transparent;
-            }}
-            QScrollBar:vertical {{
-                background: {HTB_BG_DARKEST};
-                width: 8px;
-                border-radius: 4px;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {HTB_BG_HOVER};
-                border-radius: 4px;
-                min-height: 20px;
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0;
-            }}
-        """)
+        self._content_scroll.setObjectName("toolkitScroll")
         layout.addWidget(self._content_scroll)
 
-        # Build tabs
-        self._encoder_widget = self._build_encoder_tab()
-        self._shells_widget = self._build_shells_tab()
-        self._payloads_widget = self._build_payloads_tab()
+        # Tabs live in a stack inside the scroll area; each one is built
+        # the first time it is shown.
+        self._stack = QStackedWidget()
+        self._content_scroll.setWidget(self._stack)
+        self._tab_builders = {
+            "encoder": self._build_encoder_tab,
+            "shells": self._build_shells_tab,
+            "payloads": self._build_payloads_tab,
+        }
+        self._tab_widgets: dict[str, QWidget] = {}
 
         # Start on encoder
         self._switch_tab("encoder")
@@ -351,29 +522,36 @@ class ToolkitPage(QWidget):
     # TAB SWITCHING
     # -------------------------------------------------------
 
+    def _on_tab_clicked(self):
+        self._switch_tab(self.sender().tab_id)
+
     def _switch_tab(self, tab_id: str):
         for tid, btn in self._tab_btns.items():
-            btn.setChecked(tid == tab_id)
+            btn.set_active(tid == tab_id)
 
-        # Remove current widget without deleting it
-        old = self._content_scroll.takeWidget()
-        if old:
-            old.setParent(None)
+        page = self._tab_widgets.get(tab_id)
+        if page is None:
+            page = self._tab_builders[tab_id]()
+            self._tab_widgets[tab_id] = page
+            self._stack.addWidget(page)
 
-        if tab_id == "encoder":
-            self._content_scroll.setWidget(self._encoder_widget)
-        elif tab_id == "shells":
+        if tab_id == "shells":
             # Refresh tun0 IP
             ip = _get_tun0_ip()
             if ip:
                 self._ip = ip
                 self.ip_input.setText(ip)
-            self._content_scroll.setWidget(self._shells_widget)
         elif tab_id == "payloads":
             ip = _get_tun0_ip()
             if ip:
                 self._ip = ip
-            self._content_scroll.setWidget(self._payloads_widget)
+
+        # Only the visible page contributes to the stack's size hint, so the
+        # scroll range follows the current tab instead of the tallest one.
+        for w in self._tab_widgets.values():
+            policy = QSizePolicy.Preferred if w is page else QSizePolicy.Ignored
+            w.setSizePolicy(policy, policy)
+        self._stack.setCurrentWidget(page)
 
     # -------------------------------------------------------
     # TAB 1: ENCODER / DECODER
@@ -387,24 +565,18 @@ class ToolkitPage(QWidget):
 
         # Input
         in_label = QLabel("INPUT")
-        in_label.setStyleSheet(f"color: {HTB_TEXT_DIM}; font-size: 11px; font-weight: 700; letter-spacing: 1.5px;")
+        in_label.setProperty("role", "section")
         layout.addWidget(in_label)
 
-        self.enc_input = QTextEdit()
+        self.enc_input = QPlainTextEdit()
         self.enc_input.setPlaceholderText("Paste text here...")
         self.enc_input.setMinimumHeight(120)
         self.enc_input.setMaximumHeight(200)
-        self.enc_input.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {HTB_BG_MAIN};
-                border: 1px solid {HTB_BORDER};
-                border-radius: 8px;
-                color: {HTB_TEXT_MAIN};
-                font-family: 'JetBrains Mono', 'Fira Code', 'Consolas', monospace;
-                font-size: 13px;
-                padding: 10px;
-            }}
-        """)
+        # No wrapping: a huge single-line paste lays out only what is visible
+        self.enc_input.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self._enc_text = ""  # shadow of the input, spliced on each edit
+        self.enc_input.document().contentsChange.connect(self._on_enc_contents_change)
+        self.enc_input.setObjectName("encInput")
         layout.addWidget(self.enc_input)
 
         # Controls row
@@ -415,11 +587,15 @@ class ToolkitPage(QWidget):
         for op in ENCODING_OPS:
             self.op_combo.addItem(op)
         self.op_combo.setMinimumWidth(200)
-        self.op_combo.currentIndexChanged.connect(lambda: self._apply_encoding())
+        self.op_combo.currentIndexChanged.connect(self._apply_encoding)
         ctrl.addWidget(self.op_combo)
 
-        # Auto-apply on text change
-        self.enc_input.textChanged.connect(self._apply_encoding)
+        # Auto-apply on text change, debounced so a typing burst encodes once
+        self._enc_timer = QTimer(self)
+        self._enc_timer.setSingleShot(True)
+        self._enc_timer.setInterval(80)
+        self._enc_timer.timeout.connect(self._apply_encoding)
+        self.enc_input.textChanged.connect(self._enc_timer.start)
 
         swap_btn = ModernButton("⇅ Swap", btn_type="secondary")
         swap_btn.clicked.connect(self._swap_io)
@@ -434,29 +610,20 @@ class ToolkitPage(QWidget):
 
         # Output
         out_label = QLabel("OUTPUT")
-        out_label.setStyleSheet(f"color: {HTB_TEXT_DIM}; font-size: 11px; font-weight: 700; letter-spacing: 1.5px;")
+        out_label.setProperty("role", "section")
         layout.addWidget(out_label)
 
         out_row = QVBoxLayout()
-        self.enc_output = QTextEdit()
+        self.enc_output = QPlainTextEdit()
         self.enc_output.setReadOnly(True)
         self.enc_output.setMinimumHeight(120)
         self.enc_output.setMaximumHeight(200)
-        self.enc_output.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {HTB_BG_MAIN};
-                border: 1px solid {HTB_BORDER};
-                border-radius: 8px;
-                color: {HTB_GREEN};
-                font-family: 'JetBrains Mono', 'Fira Code', 'Consolas', monospace;
-                font-size: 13px;
-                padding: 10px;
-            }}
-        """)
+        self.enc_output.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.enc_output.setObjectName("encOutput")
         out_row.addWidget(self.enc_output)
 
         copy_out_btn = _CopyButton("📋 Copy Output", self)
-        copy_out_btn.clicked.connect(lambda: self._copy_output(copy_out_btn))
+        copy_out_btn.clicked.connect(self._copy_output)
         out_row.addWidget(copy_out_btn, alignment=Qt.AlignLeft)
 
         layout.addLayout(out_row)
@@ -464,25 +631,53 @@ class ToolkitPage(QWidget):
 
         return w
 
+    def _on_enc_contents_change(self, position: int, removed: int, added: int):
+        """Splice the edit into the shadow text instead of re-reading the document."""
+        doc = self.enc_input.document()
+        end = doc.characterCount() - 1  # excludes the trailing block separator
+        chunk = ""
+        if added:
+            cur = QTextCursor(doc)
+            cur.setPosition(min(position, end))
+            cur.setPosition(min(position + added, end), QTextCursor.KeepAnchor)
+            chunk = cur.selectedText().translate(_PLAIN_TEXT_MAP)
+        text = self._enc_text[:position] + chunk + self._enc_text[position + removed:]
+        if len(text) != end:
+            text = doc.toPlainText()  # counts disagree (e.g. a full reset): resync
+        self._enc_text = text
+
     def _apply_encoding(self):
-        text = self.enc_input.toPlainText()
+        text = self._enc_text
         op = self.op_combo.currentText()
-        result = _apply_encoding(op, text)
+        memo = self._enc_memo
+        if memo is not None and memo[0] == op and memo[1] == text:
+            result = memo[2]
+        else:
+            result = _apply_encoding(op, text)
+            self._enc_memo = (op, text, result)
+        if result == self._last_enc_result:
+            return
+        self._last_enc_result = result
         self.enc_output.setPlainText(result)
 
     def _swap_io(self):
         out = self.enc_output.toPlainText()
-        inp = self.enc_input.toPlainText()
+        inp = self._enc_text
         self.enc_input.setPlainText(out)
+        # setPlainText re-armed the debounce; don't let it encode over the swap
+        self._enc_timer.stop()
         self.enc_output.setPlainText(inp)
+        self._last_enc_result = inp
 
     def _clear_enc(self):
         self.enc_input.clear()
+        self._enc_timer.stop()
         self.enc_output.clear()
+        self._last_enc_result = ""
 
-    def _copy_output(self, btn: _CopyButton):
+    def _copy_output(self):
         QApplication.clipboard().setText(self.enc_output.toPlainText())
-        btn.flash_copied()
+        self.sender().flash_copied()
 
     # -------------------------------------------------------
     # TAB 2: REVERSE SHELLS
@@ -496,48 +691,29 @@ class ToolkitPage(QWidget):
 
         # IP / Port controls
         ctrl_frame = QFrame()
-        ctrl_frame.setStyleSheet(f"background-color: {HTB_BG_MAIN}; border-radius: 10px;")
+        ctrl_frame.setProperty("role", "paramBar")
         ctrl_layout = QHBoxLayout(ctrl_frame)
         ctrl_layout.setContentsMargins(16, 12, 16, 12)
         ctrl_layout.setSpacing(16)
 
         ip_lbl = QLabel("LHOST")
-        ip_lbl.setStyleSheet(f"color: {HTB_TEXT_DIM}; font-size: 11px; font-weight: 700; letter-spacing: 1px; border: none;")
+        ip_lbl.setProperty("role", "paramLabel")
         ctrl_layout.addWidget(ip_lbl)
 
         self.ip_input = QLineEdit(self._ip)
         self.ip_input.setMinimumWidth(160)
-        self.ip_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {HTB_BG_DARKEST};
-                border: 1px solid {HTB_BORDER};
-                border-radius: 6px;
-                color: {HTB_GREEN};
-                font-family: 'JetBrains Mono', monospace;
-                font-size: 13px;
-                padding: 6px 10px;
-            }}
-        """)
+        self.ip_input.setProperty("role", "param")
         self.ip_input.textChanged.connect(self._on_params_changed)
         ctrl_layout.addWidget(self.ip_input)
 
         port_lbl = QLabel("LPORT")
-        port_lbl.setStyleSheet(f"color: {HTB_TEXT_DIM}; font-size: 11px; font-weight: 700; letter-spacing: 1px; border: none;")
+        port_lbl.setProperty("role", "paramLabel")
         ctrl_layout.addWidget(port_lbl)
 
         self.port_input = QLineEdit(self._port)
         self.port_input.setFixedWidth(80)
-        self.port_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {HTB_BG_DARKEST};
-                border: 1px solid {HTB_BORDER};
-                border-radius: 6px;
-                color: {HTB_GREEN};
-                font-family: 'JetBrains Mono', monospace;
-                font-size: 13px;
-                padding: 6px 10px;
-            }}
-        """)
+        self.port_input.setValidator(QIntValidator(1, 65535, self.port_input))
+        self.port_input.setProperty("role", "param")
         self.port_input.textChanged.connect(self._on_params_changed)
         ctrl_layout.addWidget(port_lbl)
         ctrl_layout.addWidget(self.port_input)
@@ -546,65 +722,82 @@ class ToolkitPage(QWidget):
         tun0_ip = _get_tun0_ip()
         if tun0_ip:
             tun0_lbl = QLabel(f"🟢 tun0: {tun0_ip}")
-            tun0_lbl.setStyleSheet(f"color: {HTB_GREEN}; font-size: 11px; border: none;")
         else:
             tun0_lbl = QLabel("🔴 tun0: not detected")
-            tun0_lbl.setStyleSheet(f"color: {HTB_TEXT_DIM}; font-size: 11px; border: none;")
+        tun0_lbl.setObjectName("tun0Status")
+        tun0_lbl.setProperty("up", bool(tun0_ip))
         ctrl_layout.addWidget(tun0_lbl)
 
         ctrl_layout.addStretch()
 
         # Listener command
         listener_lbl = QLabel("Listener:")
-        listener_lbl.setStyleSheet(f"color: {HTB_TEXT_DIM}; font-size: 11px; font-weight: 600; border: none;")
+        listener_lbl.setObjectName("listenerLabel")
         ctrl_layout.addWidget(listener_lbl)
 
         self.listener_cmd = QLabel(f"nc -lvnp {self._port}")
-        self.listener_cmd.setStyleSheet(f"""
-            color: {HTB_TEXT_SEC};
-            font-family: 'JetBrains Mono', monospace;
-            font-size: 12px;
-            background-color: {HTB_BG_DARKEST};
-            border: 1px solid {HTB_BORDER};
-            border-radius: 4px;
-            padding: 4px 8px;
-        """)
+        self.listener_cmd.setObjectName("listenerCmd")
         ctrl_layout.addWidget(self.listener_cmd)
 
         listener_copy = _CopyButton("📋", self)
         listener_copy.setFixedSize(36, 28)
-        listener_copy.clicked.connect(lambda: self._copy_listener(listener_copy))
+        listener_copy.clicked.connect(self._copy_listener)
         ctrl_layout.addWidget(listener_copy)
 
         layout.addWidget(ctrl_frame)
 
         # Shell cards
         shells_label = QLabel("SHELLS")
-        shells_label.setStyleSheet(f"color: {HTB_TEXT_DIM}; font-size: 11px; font-weight: 700; letter-spacing: 1.5px;")
+        shells_label.setProperty("role", "section")
         layout.addWidget(shells_label)
 
-        self._shell_cards: list[_CodeSnippet] = []
-        grid = QGridLayout()
-        grid.setSpacing(8)
-        for i, shell in enumerate(REVERSE_SHELLS):
-            card = _CodeSnippet(shell["name"], shell["cmd"], self._ip, self._port)
-            self._shell_cards.append(card)
-            grid.addWidget(card, i // 2, i % 2)
+        self._shell_cards: list[_CodeSnippet] = [
+            _CodeSnippet(shell["name"], shell["cmd"], self._ip, self._port)
+            for shell in REVERSE_SHELLS
+        ]
+        grid = self._new_card_grid()
+        w.setUpdatesEnabled(False)
+        try:
+            self._fill_grid(grid, self._shell_cards)
+        finally:
+            w.setUpdatesEnabled(True)
         layout.addLayout(grid)
 
         layout.addStretch()
         return w
 
+    @staticmethod
+    def _new_card_grid() -> QGridLayout:
+        grid = QGridLayout()
+        grid.setSpacing(8)
+        grid.setColumnStretch(0, 1)
+        grid.setColumnStretch(1, 1)
+        return grid
+
+    @staticmethod
+    def _fill_grid(grid: QGridLayout, cards: list[_CodeSnippet]):
+        """Place cards two per row with layout activation held off until done."""
+        grid.setEnabled(False)
+        try:
+            for i, card in enumerate(cards):
+                grid.addWidget(card, i // 2, i % 2)
+        finally:
+            grid.setEnabled(True)
+
     def _on_params_changed(self):
+        if not _is_port_text(self.port_input.text()):
+            return
+        self._params_timer.start(50)
+
+    def _flush_params(self):
         self._ip = self.ip_input.text()
         self._port = self.port_input.text() or "4444"
         self.listener_cmd.setText(f"nc -lvnp {self._port}")
-        for card in self._shell_cards:
-            card.update_params(self._ip, self._port)
+        self._update_cards(self._shell_cards, self._ip, self._port)
 
-    def _copy_listener(self, btn: _CopyButton):
+    def _copy_listener(self):
         QApplication.clipboard().setText(self.listener_cmd.text())
-        btn.flash_copied()
+        self.sender().flash_copied()
 
     # -------------------------------------------------------
     # TAB 3: QUICK PAYLOADS
@@ -618,75 +811,73 @@ class ToolkitPage(QWidget):
 
         # IP / Port controls for payloads
         ctrl_frame = QFrame()
-        ctrl_frame.setStyleSheet(f"background-color: {HTB_BG_MAIN}; border-radius: 10px;")
+        ctrl_frame.setProperty("role", "paramBar")
         ctrl_layout = QHBoxLayout(ctrl_frame)
         ctrl_layout.setContentsMargins(16, 10, 16, 10)
         ctrl_layout.setSpacing(12)
 
         ip_lbl = QLabel("LHOST")
-        ip_lbl.setStyleSheet(f"color: {HTB_TEXT_DIM}; font-size: 11px; font-weight: 700; letter-spacing: 1px; border: none;")
+        ip_lbl.setProperty("role", "paramLabel")
         ctrl_layout.addWidget(ip_lbl)
 
         self.pay_ip_input = QLineEdit(self._ip)
         self.pay_ip_input.setMinimumWidth(140)
-        self.pay_ip_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {HTB_BG_DARKEST};
-                border: 1px solid {HTB_BORDER};
-                border-radius: 6px;
-                color: {HTB_GREEN};
-                font-family: 'JetBrains Mono', monospace;
-                font-size: 13px;
-                padding: 5px 8px;
-            }}
-        """)
+        self.pay_ip_input.setProperty("role", "paramSmall")
         self.pay_ip_input.textChanged.connect(self._on_payload_params_changed)
         ctrl_layout.addWidget(self.pay_ip_input)
 
         port_lbl = QLabel("LPORT")
-        port_lbl.setStyleSheet(f"color: {HTB_TEXT_DIM}; font-size: 11px; font-weight: 700; letter-spacing: 1px; border: none;")
+        port_lbl.setProperty("role", "paramLabel")
         ctrl_layout.addWidget(port_lbl)
 
         self.pay_port_input = QLineEdit(self._port)
         self.pay_port_input.setFixedWidth(70)
-        self.pay_port_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {HTB_BG_DARKEST};
-                border: 1px solid {HTB_BORDER};
-                border-radius: 6px;
-                color: {HTB_GREEN};
-                font-family: 'JetBrains Mono', monospace;
-                font-size: 13px;
-                padding: 5px 8px;
-            }}
-        """)
+        self.pay_port_input.setValidator(QIntValidator(1, 65535, self.pay_port_input))
+        self.pay_port_input.setProperty("role", "paramSmall")
         self.pay_port_input.textChanged.connect(self._on_payload_params_changed)
         ctrl_layout.addWidget(self.pay_port_input)
 
         ctrl_layout.addStretch()
         layout.addWidget(ctrl_frame)
 
-        # Payload cards
+        # Payload cards (the whole tab is only built on first activation)
         self._payload_cards: list[_CodeSnippet] = []
-
-        for category, payloads in QUICK_PAYLOADS.items():
-            cat_lbl = QLabel(category.upper())
-            cat_lbl.setStyleSheet(f"color: {HTB_TEXT_DIM}; font-size: 11px; font-weight: 700; letter-spacing: 1.5px;")
-            layout.addWidget(cat_lbl)
-
-            grid = QGridLayout()
-            grid.setSpacing(8)
-            for i, (name, code) in enumerate(payloads):
-                card = _CodeSnippet(name, code, ip=self._ip, port=self._port)
-                grid.addWidget(card, i // 2, i % 2)
-                self._payload_cards.append(card)
-            layout.addLayout(grid)
+        ip = self.pay_ip_input.text()
+        port = self.pay_port_input.text() or "4444"
+        w.setUpdatesEnabled(False)
+        try:
+            for category, payloads in QUICK_PAYLOADS.items():
+                cat_lbl = QLabel(category.upper())
+                cat_lbl.setProperty("role", "section")
+                layout.addWidget(cat_lbl)
+
+                cards = [_CodeSnippet(name, code, ip=ip, port=port) for name, code in payloads]
+                grid = self._new_card_grid()
+                self._fill_grid(grid, cards)
+                layout.addLayout(grid)
+                self._payload_cards.extend(cards)
+        finally:
+            w.setUpdatesEnabled(True)
 
         layout.addStretch()
         return w
 
     def _on_payload_params_changed(self):
+        if not _is_port_text(self.pay_port_input.text()):
+            return
+        self._pay_params_timer.start(50)
+
+    def _flush_payload_params(self):
         ip = self.pay_ip_input.text()
         port = self.pay_port_input.text() or "4444"
-        for card in self._payload_cards:
-            card.update_params(ip, port)
+        self._update_cards(self._payload_cards, ip, port)
+
+    def _update_cards(self, cards: list[_CodeSnippet], ip: str, port: str):
+        """Push new params to every card with viewport repaints held off."""
+        viewport = self._content_scroll.viewport()
+        viewport.setUpdatesEnabled(False)
+        try:
+            for card in cards:
+                card.update_params(ip, port)
+        finally:
+            viewport.setUpdatesEnabled(True)
@@ -1,10 +1,14 @@
 """VPN Page - Borderless HTB Style."""
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QComboBox, QFrame, QMessageBox, QFileDialog, QSizePolicy
 )
-from PySide6.QtCore import Qt, Signal, Slot, QThread, QObject
+from PySide6.QtCore import Qt, Signal, Slot, QObject, QRunnable, QThreadPool
+from typing import Optional
 
 from api.endpoints import HTBApi
 from models.connection import Connection
@@ -13,35 +17,137 @@ from ui.widgets.modern_widgets import ModernButton
 from utils.debug import debug_log
 
 
-class VPNWorker(QObject):
-    finished = Signal(dict)
-    error = Signal(str)
+# One sheet for the whole page. The frame rules also cover their children,
+# like the unscoped per-frame sheets they replace did.
+_VPN_QSS = f"""
+QLabel#pageTitle {{
+    font-size: 28px;
+    font-weight: 700;
+    letter-spacing: -0.5px;
+}}
+QLabel[role="section"] {{
+    color: {HTB_TEXT_DIM};
+    font-size: 11px;
+    font-weight: 700;
+    letter-spacing: 1.5px;
+}}
+QFrame#vpnStatus, QFrame#vpnStatus QLabel {{
+    background-color: {HTB_BG_CARD};
+    border-radius: 12px;
+}}
+QLabel#vpnStatusIcon {{
+    font-size: 32px;
+}}
+QLabel#vpnStatusText {{
+    font-size: 18px;
+    font-weight: 600;
+}}
+QLabel#vpnStatusDetails {{
+    color: {HTB_TEXT_DIM};
+    font-size: 14px;
+}}
+QFrame#vpnDownload, QFrame#vpnDownload QLabel,
+QFrame#vpnDownload QComboBox, QFrame#vpnDownload QComboBox QAbstractItemView {{
+    background-color: {HTB_BG_MAIN};
+    border-radius: 12px;
+}}
+QLabel[role="field"] {{
+    color: {HTB_TEXT_DIM};
+}}
+QLabel#vpnHelp {{
+    color: {HTB_TEXT_DIM};
+    font-size: 13px;
+}}
+"""
+
+
+def _first_nonspace(data: bytes, limit: int = 64) -> int:
+    """Index of the first non-whitespace byte within limit, or -1."""
+    for i, c in enumerate(data[:limit]):
+        if c not in b" \t\r\n":
+            return i
+    return -1
+
+
+_SERVERS_TTL = 60.0  # seconds
+# arena -> (fetched at, (success, result))
+_SERVERS_CACHE: dict = {}
+
+
+def _cached_servers(arena: str):
+    """HTBApi.get_vpn_servers, reusing a successful response for 60 s."""
+    now = time.monotonic()
+    hit = _SERVERS_CACHE.get(arena)
+    if hit and now - hit[0] < _SERVERS_TTL:
+        return hit[1]
+    res = HTBApi.get_vpn_servers(arena)
+    if res[0]:
+        _SERVERS_CACHE[arena] = (now, res)
+    return res
+
+
+# Long-lived helper thread for the servers call, so a refresh doesn't spin
+# up (and tear down) its own executor threads
+_SIDE_FETCH = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vpn-servers")
+
+
+class VPNSignals(QObject):
+    # (load id, payload) so the page can drop results from superseded loads
+    finished = Signal(int, dict)
+    error = Signal(int, str)
+
+
+class VPNTask(QRunnable):
+    """Fetches connection status and the server catalog on a pool thread."""
+    
+    def __init__(self, load_id: int, signals: VPNSignals):
+        super().__init__()
+        self.load_id = load_id
+        self.signals = signals
     
     def run(self):
         data = {}
+        errors = []
+        # Both calls are independent: servers on the helper thread, status here
+        try:
+            f_servers = _SIDE_FETCH.submit(_cached_servers, "competitive")
+        except RuntimeError:
+            return  # helper shut down: the app is closing
+        
         try:
             success, result = HTBApi.get_connection_status()
             if success and isinstance(result, list) and len(result) > 0:
                 data["connection"] = Connection.from_api(result[0])
-            
-            success, result = HTBApi.get_vpn_servers("competitive")
+        except Exception as e:
+            errors.append(str(e))
+        
+        try:
+            success, result = f_servers.result()
             if success:
                 data["servers"] = result
-            
-            self.finished.emit(data)
         except Exception as e:
-            self.error.emit(str(e))
+            errors.append(str(e))
+        
+        if len(errors) == 2:
+            self.signals.error.emit(self.load_id, errors[0])
+            return
+        for err in errors:
+            debug_log("VPN", f"Partial load error: {err}")
+        self.signals.finished.emit(self.load_id, data)
 
 
 class VPNPage(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._servers = {}
-        self._thread = None
-        self._worker = None
+        self._last_servers_key: Optional[tuple] = None
+        self._signals = VPNSignals(self)
+        self._signals.finished.connect(self._on_task_finished)
+        self._signals.error.connect(self._on_task_error)
+        self._load_id = 0
         self._loading = False
         self._loaded = False
-        self._zombie_threads: List[QThread] = []
+        self.setStyleSheet(_VPN_QSS)
         self._setup_ui()
     
     def _setup_ui(self):
@@ -51,35 +157,35 @@ class VPNPage(QWidget):
         
         # Header
         title = QLabel("VPN Connection")
-        title.setStyleSheet("font-size: 28px; font-weight: 700; letter-spacing: -0.5px;")
+        title.setObjectName("pageTitle")
         layout.addWidget(title)
         
         # Status
         section1 = QLabel("CONNECTION STATUS")
-        section1.setStyleSheet(f"color: {HTB_TEXT_DIM}; font-size: 11px; font-weight: 700; letter-spacing: 1.5px;")
+        section1.setProperty("role", "section")
         layout.addWidget(section1)
         
         status_frame = QFrame()
-        status_frame.setStyleSheet(f"background-color: {HTB_BG_CARD}; border-radius: 12px;")
+        status_frame.setObjectName("vpnStatus")
         status_frame.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
         
         status_layout = QHBoxLayout(status_frame)
         status_layout.setContentsMargins(24, 20, 24, 20)
         
         self.status_icon = QLabel("🔴")
-        self.status_icon.setStyleSheet("font-size: 32px;")
+        self.status_icon.setObjectName("vpnStatusIcon")
         status_layout.addWidget(self.status_icon)
         
         status_info = QVBoxLayout()
         status_info.setSpacing(2)
         
         self.status_text = QLabel("Disconnected")
-        self.status_text.setStyleSheet("font-size: 18px; font-weight: 600;")
+        self.status_text.setObjectName("vpnStatusText")
         self.status_text.setWordWrap(True)
         status_info.addWidget(self.status_text)
         
         self.status_details = QLabel("Connect using your VPN client")
-        self.status_details.setStyleSheet(f"color: {HTB_TEXT_DIM}; font-size: 14px;")
+        self.status_details.setObjectName("vpnStatusDetails")
         self.status_details.setWordWrap(True)
         status_info.addWidget(self.status_details)
         
@@ -94,11 +200,11 @@ class VPNPage(QWidget):
         
         # Download
         section2 = QLabel("DOWNLOAD CONFIG")
-        section2.setStyleSheet(f"color: {HTB_TEXT_DIM}; font-size: 11px; font-weight: 700; letter-spacing: 1.5px;")
+        section2.setProperty("role", "section")
         layout.addWidget(section2)
         
         dl_frame = QFrame()
-        dl_frame.setStyleSheet(f"background-color: {HTB_BG_MAIN}; border-radius: 12px;")
+        dl_frame.setObjectName("vpnDownload")
         dl_frame.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
         
         dl_layout = QVBoxLayout(dl_frame)
@@ -110,7 +216,7 @@ class VPNPage(QWidget):
         row1.setSpacing(16)
         
         region_lbl = QLabel("Region:")
-        region_lbl.setStyleSheet(f"color: {HTB_TEXT_DIM};")
+        region_lbl.setProperty("role", "field")
         row1.addWidget(region_lbl)
         
         self.region_combo = QComboBox()
@@ -121,7 +227,7 @@ class VPNPage(QWidget):
         row1.addSpacing(24)
         
         proto_lbl = QLabel("Protocol:")
-        proto_lbl.setStyleSheet(f"color: {HTB_TEXT_DIM};")
+        proto_lbl.setProperty("role", "field")
         row1.addWidget(proto_lbl)
         
         self.proto_combo = QComboBox()
@@ -136,7 +242,7 @@ class VPNPage(QWidget):
         row2.setSpacing(16)
         
         server_lbl = QLabel("Server:")
-        server_lbl.setStyleSheet(f"color: {HTB_TEXT_DIM};")
+        server_lbl.setProperty("role", "field")
         row2.addWidget(server_lbl)
         
         self.server_combo = QComboBox()
@@ -154,13 +260,14 @@ class VPNPage(QWidget):
         
         # Help
         help_text = QLabel("💡 Import the downloaded .ovpn file into OpenVPN or another VPN client to connect.")
-        help_text.setStyleSheet(f"color: {HTB_TEXT_DIM}; font-size: 13px;")
+        help_text.setObjectName("vpnHelp")
         help_text.setWordWrap(True)
         layout.addWidget(help_text)
         
         layout.addStretch()
     
     def _force_reload(self):
+        _SERVERS_CACHE.pop("competitive", None)
         self._loaded = False
         self.load_data()
     
@@ -168,49 +275,34 @@ class VPNPage(QWidget):
         if self._loading:
             return
         self._loading = True
-        self._cleanup_thread()
-        
-        self._thread = QThread()
-        self._worker = VPNWorker()
-        self._worker.moveToThread(self._thread)
-        self._thread.started.connect(self._worker.run)
-        self._worker.finished.connect(self._on_loaded)
-        self._worker.error.connect(self._on_error)
-        self._thread.start()
+        self._load_id += 1
+        QThreadPool.globalInstance().start(VPNTask(self._load_id, self._signals))
     
-    def _safe_cleanup_thread(self, thread: QThread, worker: QObject):
-        if not thread: return
-        if worker:
-            try: worker.disconnect()
-            except: pass
-        if thread.isRunning():
-            self._zombie_threads.append(thread)
-            thread.finished.connect(lambda t=thread: self._on_zombie_finished(t))
-            thread.quit()
-        else:
-            thread.deleteLater()
-            if worker: worker.deleteLater()
+    def _cancel_load(self):
+        """Forget any in-flight load; its results will be ignored."""
+        self._load_id += 1
+        self._loading = False
 
-    def _on_zombie_finished(self, thread: QThread):
-        if thread in self._zombie_threads:
-            self._zombie_threads.remove(thread)
-        thread.deleteLater()
+    def stop_background_tasks(self):
+        """Llamado al cerrar la app para descartar resultados pendientes."""
+        self._cancel_load()
+        # Drop queued servers calls so exit doesn't wait on the helper thread
+        _SIDE_FETCH.shutdown(wait=False, cancel_futures=True)
 
-    def _cleanup_thread(self):
-        self._safe_cleanup_thread(self._thread, self._worker)
-        self._thread = None
-        self._worker = None
+    @Slot(int, dict)
+    def _on_task_finished(self, load_id: int, data: dict):
+        if load_id == self._load_id:
+            self._on_loaded(data)
 
-    def stop_background_tasks(self):
-        """Llamado al cerrar la app para evitar QThread destroyed while running."""
-        self._loading = False
-        self._cleanup_thread()
+    @Slot(int, str)
+    def _on_task_error(self, load_id: int, error: str):
+        if load_id == self._load_id:
+            self._on_error(error)
     
     @Slot(dict)
     def _on_loaded(self, data: dict):
         self._loading = False
         self._loaded = True
-        self._cleanup_thread()
         
         if "connection" in data and data["connection"]:
             c = data["connection"]
@@ -229,20 +321,33 @@ class VPNPage(QWidget):
     @Slot(str)
     def _on_error(self, error: str):
         self._loading = False
-        self._cleanup_thread()
         debug_log("VPN", f"Error: {error}")
     
     def _update_servers(self):
         region = self.region_combo.currentText()
-        self.server_combo.clear()
-        
-        if region in self._servers:
-            for arena_data in self._servers[region].values():
-                for sid, server in arena_data.get("servers", {}).items():
-                    status = "🟢" if not server.get("full") else "🔴"
-                    clients = server.get("current_clients", 0)
-                    name = server.get("friendly_name", f"Server {sid}")
-                    self.server_combo.addItem(f"{status} {name} ({clients} users)", int(sid))
+        items = []
+        for arena_data in self._servers.get(region, {}).values():
+            for sid, server in arena_data.get("servers", {}).items():
+                status = "🟢" if not server.get("full") else "🔴"
+                clients = server.get("current_clients", 0)
+                name = server.get("friendly_name", f"Server {sid}")
+                items.append((f"{status} {name} ({clients} users)", int(sid)))
+        
+        key = (region, tuple(items))
+        if key == self._last_servers_key:
+            return
+        self._last_servers_key = key
+        
+        # Fill in one batch: no per-item signals or popup relayouts
+        combo = self.server_combo
+        view = combo.view()
+        combo.blockSignals(True)
+        view.setUpdatesEnabled(False)
+        combo.clear()
+        for label, sid in items:
+            combo.addItem(label, sid)
+        view.setUpdatesEnabled(True)
+        combo.blockSignals(False)
     
     def _download(self):
         server_id = self.server_combo.currentData()
@@ -272,7 +377,8 @@ class VPNPage(QWidget):
             QMessageBox.warning(self, "Error", "Respuesta inválida del servidor (¿rate limit?). Intenta de nuevo.")
             return
         # No guardar HTML (ej. página de error 429)
-        if result.lstrip()[:1] == b"<":
+        idx = _first_nonspace(result)
+        if idx >= 0 and result[idx:idx + 1] == b"<":
             QMessageBox.warning(self, "Error", "El servidor devolvió una página de error. Espera unos segundos (rate limit) e intenta de nuevo.")
             return
         filename, _ = QFileDialog.getSaveFileName(
@@ -292,4 +398,4 @@ class VPNPage(QWidget):
     
     def hideEvent(self, event):
         super().hideEvent(event)
-        self._cleanup_thread()
+        self._cancel_load()
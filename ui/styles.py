@@ -51,11 +51,37 @@ GRADIENT_BTN  = f"qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {HTB_GREEN}, st
 FONT_FAMILY_MAIN = "'Inter', 'Segoe UI', 'Roboto', sans-serif"
 FONT_FAMILY_MONO = "'JetBrains Mono', 'Fira Code', 'Consolas', monospace"
 
+# --- BADGES (ui/widgets/status_badge.py) ---
+# name -> (background, text); "neutral" is the fallback for unknown styles
+BADGE_STYLES = {
+    "success": (STATUS_SUCCESS, "#ffffff"),
+    "warning": (STATUS_WARNING, "#000000"),
+    "error": (STATUS_ERROR, "#ffffff"),
+    "info": (STATUS_INFO, "#ffffff"),
+    "htb": (HTB_GREEN, "#000000"),
+    "neutral": (HTB_TEXT_DIM, "#ffffff"),
+}
+# casefolded difficulty -> text colour (the background is the same at 20 alpha)
+DIFFICULTY_COLORS = {
+    "easy": "#9fef00",
+    "medium": "#ffaf00",
+    "hard": "#ff3e3e",
+    "insane": "#7d3c98",
+}
+
+_BADGE_RULES = "\n".join(
+    [f"StatusBadge {{ background-color: {BADGE_STYLES['neutral'][0]}; color: {BADGE_STYLES['neutral'][1]}; }}"]
+    + [f'StatusBadge[badge_style="{name}"] {{ background-color: {bg}; color: {fg}; }}'
+       for name, (bg, fg) in BADGE_STYLES.items() if name != "neutral"]
+    + ["", "DifficultyBadge { background-color: #ffffff20; color: #ffffff; }"]
+    + [f'DifficultyBadge[difficulty="{name}"] {{ background-color: {color}20; color: {color}; }}'
+       for name, color in DIFFICULTY_COLORS.items()]
+)
+
 # --- GLOBAL STYLESHEET ---
 GLOBAL_STYLE = f"""
-/* Global Reset */
+/* Global Reset (font family comes from the application font, see main.py) */
 * {{
-    font-family: {FONT_FAMILY_MAIN};
     color: {HTB_TEXT_MAIN};
     outline: none;
 }}
@@ -168,6 +194,9 @@ QComboBox::drop-down {{
     padding-right: 8px;
 }}
 
+/* Arrow is a border triangle, no image asset. If sheets ever need image:
+   url(...), serve it from a compiled Qt resource (":/...") - file paths are
+   re-read by the style on every size query. */
 QComboBox::down-arrow {{
     image: none;
     border: none;
@@ -227,6 +256,177 @@ QHeaderView::section {{
     border-bottom: 1px solid {HTB_BORDER};
     font-weight: 600;
 }}
+
+/* --- Shared widgets (ui/widgets) --- */
+/* Styled here once instead of a setStyleSheet() per instance */
+
+ModernButton {{
+    background-color: {HTB_BG_HOVER};
+    border: 1px solid {HTB_BORDER};
+    border-radius: 6px;
+    color: {HTB_TEXT_SEC};
+    font-weight: 600;
+    font-size: 13px;
+    padding: 0 16px;
+}}
+
+ModernButton:hover {{
+    background-color: {HTB_BG_CARD};
+    color: {HTB_TEXT_MAIN};
+}}
+
+ModernButton:pressed {{
+    background-color: {HTB_BG_MAIN};
+}}
+
+ModernCard {{
+    background-color: {HTB_BG_MAIN};
+    border: 1px solid {HTB_BORDER};
+    border-radius: 6px;
+}}
+
+SimpleStatCard QLabel#statTitle {{
+    color: {HTB_TEXT_SEC};
+    font-size: 11px;
+    font-weight: 700;
+    letter-spacing: 1px;
+}}
+
+SimpleStatCard QLabel#statValue {{
+    color: {HTB_GREEN};
+    font-size: 24px;
+    font-weight: 700;
+}}
+
+ModernInput {{
+    background-color: {HTB_BG_INPUT};
+    border: 1px solid {HTB_BORDER};
+    border-radius: 8px;
+    padding: 10px 14px;
+    color: {HTB_TEXT_MAIN};
+    font-size: 13px;
+}}
+
+ModernInput:focus {{
+    border: 1px solid {HTB_GREEN};
+    background-color: {HTB_BG_HOVER};
+}}
+
+ModernInput::placeholder {{
+    color: {HTB_TEXT_MUTED};
+}}
+
+MachineCard {{
+    background-color: {HTB_BG_CARD};
+    border-radius: 12px;
+    border: 1px solid {HTB_BORDER};
+}}
+
+MachineCard:hover {{
+    background-color: {HTB_BG_HOVER};
+    border-color: {HTB_GREEN};
+}}
+
+MachineCard QLabel {{
+    background: transparent;
+    border: none;
+}}
+
+MachineCard QLabel#mc_avatar {{
+    background-color: #1a2638;
+    border-radius: 8px;
+}}
+
+MachineCard QLabel#mc_avatar[loaded="true"] {{
+    background-color: transparent;
+}}
+
+MachineCard QLabel#mc_os {{
+    font-size: 20px;
+}}
+
+MachineCard QLabel#mc_diff {{
+    color: {HTB_TEXT_SEC};
+    font-size: 11px;
+    font-weight: 700;
+    letter-spacing: 0.5px;
+}}
+
+MachineCard QLabel#mc_diff[diff="easy"] {{ color: {DIFF_EASY}; }}
+MachineCard QLabel#mc_diff[diff="medium"] {{ color: {DIFF_MEDIUM}; }}
+MachineCard QLabel#mc_diff[diff="hard"] {{ color: {DIFF_HARD}; }}
+MachineCard QLabel#mc_diff[diff="insane"] {{ color: {DIFF_INSANE}; }}
+
+MachineCard QLabel#mc_name {{
+    font-size: 16px;
+    font-weight: 700;
+    color: {HTB_TEXT_MAIN};
+}}
+
+MachineCard QLabel#mc_meta {{
+    color: {HTB_TEXT_SEC};
+    font-size: 12px;
+}}
+
+MachineCard QLabel#mc_owned {{
+    color: {HTB_GREEN};
+    font-size: 12px;
+    font-weight: 600;
+}}
+
+ActivityItem#activity_item {{
+    background-color: rgba(21, 31, 46, 0.6);
+    border-radius: 10px;
+    border: none;
+}}
+
+ActivityItem QLabel#activityAvatar {{
+    background-color: #1a2638;
+    border-radius: 18px;
+}}
+
+ActivityItem QLabel#activityAvatar[loaded="true"] {{
+    background-color: transparent;
+}}
+
+ActivityItem QLabel#activityText {{
+    color: {HTB_TEXT_DIM};
+    font-size: 13px;
+}}
+
+/* Badges (ui/widgets/status_badge.py): pill + per-style colours */
+StatusBadge, DifficultyBadge {{
+    padding: 4px 12px;
+    border-radius: 12px;
+    font-weight: 600;
+    font-size: 11px;
+}}
+
+{_BADGE_RULES}
+
+OSBadge {{
+    background-color: #21262d;
+    color: #e6edf3;
+    padding: 4px 12px;
+    border-radius: 12px;
+    font-size: 12px;
+}}
+
+/* Title bar window controls (ui/widgets/title_bar.py) */
+TitleBar QPushButton#titleBtn, TitleBar QPushButton#titleBtnClose {{
+    background: transparent;
+    border: none;
+    border-radius: 4px;
+}}
+
+TitleBar QPushButton#titleBtn:hover {{
+    background-color: rgba(255, 255, 255, 0.1);
+}}
+
+TitleBar QPushButton#titleBtnClose:hover {{
+    background-color: #ff2a6d;
+    color: white;
+}}
 """
 
 # --- BUTTON STYLES (Legacy/Standard support) ---
@@ -6,22 +6,38 @@ from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QPushButton, QButtonGroup
 )
 from PySide6.QtCore import Signal, QSize, Qt
+from PySide6.QtGui import QIcon
 
-import qtawesome as qta
+from ui.widgets.modern_widgets import cached_icon
 from ui.styles import HTB_GREEN, HTB_TEXT_SEC, HTB_BG_HOVER, HTB_BG_CARD
 
+_TOP_NAV_QSS = f"""
+    QWidget {{
+        background-color: transparent;
+        border-bottom: 1px solid #222;
+    }}
+    QPushButton {{
+        background-color: transparent;
+        border: none;
+        border-radius: 8px;
+    }}
+    QPushButton:hover {{
+        background-color: {HTB_BG_HOVER};
+    }}
+    QPushButton:checked {{
+        background-color: {HTB_BG_CARD};
+        border: none;
+    }}
+"""
+
+
 class TopNav(QWidget):
     page_changed = Signal(str)
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedHeight(60)
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: transparent;
-                border-bottom: 1px solid #222;
-            }}
-        """)
+        self.setStyleSheet(_TOP_NAV_QSS)
         
         layout = QHBoxLayout(self)
         layout.setContentsMargins(20, 0, 20, 0)
@@ -60,42 +76,14 @@ class TopNav(QWidget):
         btn.setToolTip(tooltip)
         btn.setCursor(Qt.PointingHandCursor)
         
-        # Icons
-        icon_normal = qta.icon(icon_name, color=HTB_TEXT_SEC)
-        icon_active = qta.icon(icon_name, color=HTB_GREEN)
-        
-        btn.setIcon(icon_normal)
+        # One icon carrying both states; Qt picks On/Off from the checked state
+        icon = QIcon()
+        icon.addPixmap(cached_icon(icon_name, HTB_TEXT_SEC).pixmap(20, 20), QIcon.Normal, QIcon.Off)
+        icon.addPixmap(cached_icon(icon_name, HTB_GREEN).pixmap(20, 20), QIcon.Normal, QIcon.On)
+        btn.setIcon(icon)
         btn.setIconSize(QSize(20, 20))
         
-        # Store icons for state changes - we'll use a dynamic property or just re-set
-        # Using a simple approach: updated in _update_icon
-        btn.setProperty("icon_name", icon_name)
-        
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                border-radius: 8px;
-            }}
-            QPushButton:hover {{
-                background-color: {HTB_BG_HOVER};
-            }}
-            QPushButton:checked {{
-                background-color: {HTB_BG_CARD};
-                border: none;
-            }}
-        """)
-        
-        btn.toggled.connect(lambda checked, b=btn: self._update_icon(b, checked))
-        
         return btn
-    
-    def _update_icon(self, btn, checked):
-        icon_name = btn.property("icon_name")
-        if checked:
-            btn.setIcon(qta.icon(icon_name, color=HTB_GREEN))
-        else:
-            btn.setIcon(qta.icon(icon_name, color=HTB_TEXT_SEC))
 
     def _on_btn_clicked(self, btn):
         btn_id = btn.objectName()
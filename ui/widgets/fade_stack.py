@@ -5,11 +5,16 @@ FadeStackWidget - QStackedWidget with fade-in transition.
 from PySide6.QtWidgets import QStackedWidget, QWidget, QGraphicsOpacityEffect
 from PySide6.QtCore import QPropertyAnimation, QEasingCurve, Qt
 
+from config import config
+
 class FadeStackWidget(QStackedWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.duration = 200
         self.easing = QEasingCurve.OutQuad
+        # page -> fade animation (reused); page -> opacity effect while fading
+        self._effects: dict[QWidget, QGraphicsOpacityEffect] = {}
+        self._anims: dict[QWidget, QPropertyAnimation] = {}
 
     def setCurrentIndex(self, index: int):
         self.fade_to(index)
@@ -24,30 +29,46 @@ class FadeStackWidget(QStackedWidget):
         if curr_idx == index:
             return
 
-        # Hide current immediately
+        # Hide current immediately (dropping its effect if cut mid-fade)
         current = self.currentWidget()
         if current:
+            self._release_effect(current)
             current.hide()
+
+        # Read per switch so the Settings toggle applies immediately
+        if self.duration <= 0 or config.reduced_motion:
+            super().setCurrentIndex(index)
+            return
             
         # Switch to new
         super().setCurrentIndex(index)
         
-        # Animate new
+        # Animate new (animation is reused, the effect only lives for the fade)
         next_widget = self.widget(index)
         if next_widget:
-            # Create effect if needed
-            eff = next_widget.graphicsEffect()
-            if not eff or not isinstance(eff, QGraphicsOpacityEffect):
-                eff = QGraphicsOpacityEffect(next_widget)
-                next_widget.setGraphicsEffect(eff)
+            anim = self._anims.get(next_widget)
+            if anim is None:
+                anim = QPropertyAnimation(self)
+                anim.setPropertyName(b"opacity")
+                anim.setStartValue(0)
+                anim.setEndValue(1)
+                anim.finished.connect(lambda w=next_widget: self._release_effect(w))
+                self._anims[next_widget] = anim
             
-            # Reset opacity to 0
+            anim.stop()
+            eff = QGraphicsOpacityEffect(next_widget)
             eff.setOpacity(0)
-            
-            # Animate to 1
-            self.anim = QPropertyAnimation(eff, b"opacity")
-            self.anim.setDuration(self.duration)
-            self.anim.setStartValue(0)
-            self.anim.setEndValue(1)
-            self.anim.setEasingCurve(self.easing)
-            self.anim.start()
+            next_widget.setGraphicsEffect(eff)
+            self._effects[next_widget] = eff
+            anim.setTargetObject(eff)
+            anim.setDuration(self.duration)
+            anim.setEasingCurve(self.easing)
+            anim.start()
+
+    def _release_effect(self, widget: QWidget):
+        """Drop the opacity effect so the page paints directly again."""
+        anim = self._anims.get(widget)
+        if anim is not None:
+            anim.stop()
+        if self._effects.pop(widget, None) is not None:
+            widget.setGraphicsEffect(None)  # deletes the effect
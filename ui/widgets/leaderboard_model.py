@@ -0,0 +1,100 @@
+"""Season leaderboard table model."""
+
+from typing import Any, Dict, List
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QIcon
+
+from models.season import LeaderboardEntry
+
+
+def avatar_url(entry: LeaderboardEntry) -> str:
+    """Absolute avatar URL for a leaderboard entry ("" if none)."""
+    thumb = entry.avatar_thumb
+    if not thumb:
+        return ""
+    return thumb if thumb.startswith("http") else f"https://labs.hackthebox.com{thumb}"
+
+
+class LeaderboardModel(QAbstractTableModel):
+    """Rank / Player / Points / Owns rows backed by a plain list of entries."""
+
+    HEADERS = ["Rank", "Player", "Points", "Owns"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[LeaderboardEntry] = []
+        self._icons: Dict[str, QIcon] = {}  # avatar url -> rounded icon
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole) -> Any:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        e = self._rows[index.row()]
+        col = index.column()
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return f"#{e.rank}"
+            if col == 1:
+                return e.name
+            if col == 2:
+                return str(e.points)
+            if col == 3:
+                return f"{e.user_owns}/{e.root_owns}"
+        elif role == Qt.DecorationRole and col == 1:
+            return self._icons.get(avatar_url(e))
+        return None
+
+    @staticmethod
+    def _row_key(e: LeaderboardEntry) -> tuple:
+        return (e.resource_id, e.rank, e.name, e.points, e.user_owns, e.root_owns, avatar_url(e))
+
+    def update(self, entries: List[LeaderboardEntry]):
+        """
+        Apply a new leaderboard, reusing existing rows.
+        
+        Rows are matched by position; only rows whose displayed values
+        changed are reported, and the size delta is applied as a single
+        insert or remove.
+        """
+        new_rows = list(entries)
+        old_count, new_count = len(self._rows), len(new_rows)
+        common = min(old_count, new_count)
+
+        changed = [
+            row for row in range(common)
+            if self._row_key(self._rows[row]) != self._row_key(new_rows[row])
+        ]
+        self._rows[:common] = new_rows[:common]
+        for row in changed:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+        if new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            self._rows.extend(new_rows[old_count:])
+            self.endInsertRows()
+        elif new_count < old_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            del self._rows[new_count:]
+            self.endRemoveRows()
+
+    def has_avatar(self, url: str) -> bool:
+        return url in self._icons
+
+    def set_avatar(self, url: str, icon: QIcon):
+        """Attach an avatar icon to every row using url."""
+        self._icons[url] = icon
+        for row, e in enumerate(self._rows):
+            if avatar_url(e) == url:
+                idx = self.index(row, 1)
+                self.dataChanged.emit(idx, idx, [Qt.DecorationRole])
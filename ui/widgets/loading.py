@@ -4,17 +4,31 @@ Animated loading indicator.
 """
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
-from PySide6.QtCore import Qt, QTimer, Property
-from PySide6.QtGui import QPainter, QColor, QPen
+from PySide6.QtCore import Qt, QTimer, Property, QPointF
+from PySide6.QtGui import QPainter, QPainterPath, QColor, QConicalGradient
 
 from ui.styles import HTB_GREEN, HTB_BG_DARK
 
+_OVERLAY_QSS = """
+    background-color: rgba(16, 25, 39, 0.92);
+"""
+
+_MESSAGE_QSS = f"""
+    color: {HTB_GREEN};
+    font-size: 14px;
+    font-weight: 500;
+    margin-top: 16px;
+    background: transparent;
+"""
+
 
 class LoadingSpinner(QWidget):
     """
     Animated loading spinner widget.
     """
     
+    _TRAIL = 170  # degrees covered by the head plus its fading tail
+    
     def __init__(self, size: int = 40, parent=None):
         super().__init__(parent)
         self._size = size
@@ -22,13 +36,29 @@ class LoadingSpinner(QWidget):
         self._timer = QTimer(self)
         self._timer.timeout.connect(self._rotate)
         self._color = QColor(HTB_GREEN)
+        # 4px ring (static) filled with a conical gradient: a fading tail
+        # _TRAIL degrees long that ends at the head. Only the angle changes.
+        center = size / 2
+        radius = (size - 8) / 2
+        self._ring = QPainterPath()
+        self._ring.addEllipse(QPointF(center, center), radius + 2, radius + 2)
+        self._ring.addEllipse(QPointF(center, center), radius - 2, radius - 2)
+        self._gradient = QConicalGradient(center, center, 0)
+        head = self._TRAIL / 360
+        tail, lead, clear = QColor(self._color), QColor(self._color), QColor(self._color)
+        tail.setAlpha(30)
+        clear.setAlpha(0)
+        self._gradient.setColorAt(0, tail)
+        self._gradient.setColorAt(head, lead)
+        self._gradient.setColorAt(min(head + 0.001, 1), clear)
+        self._gradient.setColorAt(1, clear)
         
         self.setFixedSize(size, size)
         self.setAttribute(Qt.WA_TranslucentBackground)
     
     def start(self):
         """Start the spinner animation."""
-        self._timer.start(16)  # ~60 FPS
+        self._timer.start(33)  # ~30 FPS, plenty for a spinner
         self.show()
     
     def stop(self):
@@ -38,7 +68,9 @@ class LoadingSpinner(QWidget):
     
     def _rotate(self):
         """Rotate the spinner."""
-        self._angle = (self._angle + 10) % 360
+        if not self.isVisible():
+            return
+        self._angle = (self._angle + 20) % 360
         self.update()
     
     def paintEvent(self, event):
@@ -46,30 +78,9 @@ class LoadingSpinner(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        # Calculate dimensions
-        center = self._size // 2
-        radius = (self._size - 8) // 2
-        
-        # Draw arc
-        pen = QPen(self._color)
-        pen.setWidth(4)
-        pen.setCapStyle(Qt.RoundCap)
-        painter.setPen(pen)
-        
-        # Create gradient effect by drawing multiple arcs
-        for i in range(8):
-            alpha = 255 - (i * 30)
-            color = QColor(self._color)
-            color.setAlpha(max(alpha, 30))
-            pen.setColor(color)
-            painter.setPen(pen)
-            
-            angle = self._angle - (i * 20)
-            painter.drawArc(
-                4, 4, 
-                self._size - 8, self._size - 8,
-                angle * 16, 30 * 16
-            )
+        # Single fill pass; the tail starts _TRAIL degrees behind the head
+        self._gradient.setAngle(self._angle + 30 - self._TRAIL)
+        painter.fillPath(self._ring, self._gradient)
 
 
 class LoadingOverlay(QWidget):
@@ -82,9 +93,7 @@ class LoadingOverlay(QWidget):
         self._setup_ui(message)
     
     def _setup_ui(self, message: str):
-        self.setStyleSheet("""
-            background-color: rgba(16, 25, 39, 0.92);
-        """)
+        self.setStyleSheet(_OVERLAY_QSS)
         
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignCenter)
@@ -94,27 +103,20 @@ class LoadingOverlay(QWidget):
         layout.addWidget(self.spinner, alignment=Qt.AlignCenter)
         
         # Message
+        self._label = None
         if message:
             label = QLabel(message)
-            label.setStyleSheet(f"""
-                color: {HTB_GREEN};
-                font-size: 14px;
-                font-weight: 500;
-                margin-top: 16px;
-                background: transparent;
-            """)
+            label.setStyleSheet(_MESSAGE_QSS)
             label.setAlignment(Qt.AlignCenter)
             layout.addWidget(label)
+            self._label = label
         
-        self.spinner.start()
+        # Spinner timer is started from showEvent, not at construction
     
     def setMessage(self, message: str):
         """Update the loading message."""
-        for i in range(self.layout().count()):
-            widget = self.layout().itemAt(i).widget()
-            if isinstance(widget, QLabel):
-                widget.setText(message)
-                break
+        if self._label is not None:
+            self._label.setText(message)
     
     def showEvent(self, event):
         """Start spinner when shown."""
@@ -2,6 +2,8 @@
 Modern Custom Widgets for HTB Client.
 """
 
+from functools import lru_cache
+
 from PySide6.QtWidgets import (
     QWidget, QPushButton, QLabel, QFrame, QVBoxLayout, QHBoxLayout, 
     QGraphicsDropShadowEffect, QLineEdit
@@ -17,10 +19,20 @@ from ui.styles import (
 
 import qtawesome as qta
 
+# Only the colour varies per SimpleStatCard; the rest lives in GLOBAL_STYLE
+_SSC_VALUE_QSS_TMPL = "color: {color};"
+
+
+@lru_cache(maxsize=128)
+def cached_icon(name: str, color: str) -> QIcon:
+    """qtawesome icon, rendered once per (name, color) and shared."""
+    return qta.icon(name, color=color)
+
 
 class ModernButton(QPushButton):
     """
     A modern button with animated hover effects and custom styling.
+    Styled by the ModernButton rules in GLOBAL_STYLE.
     """
     def __init__(self, text="", icon_name=None, btn_type="primary", parent=None):
         super().__init__(text, parent)
@@ -34,46 +46,16 @@ class ModernButton(QPushButton):
             # We'll stick to a neutral color for all, maybe subtle variation.
             icon_color = HTB_TEXT_SEC
             
-            self.setIcon(qta.icon(icon_name, color=icon_color))
-
-        self._setup_style()
-
-    def _setup_style(self):
-        # Single uniform style for ALL buttons — minimalist, no colors
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {HTB_BG_HOVER};
-                border: 1px solid {HTB_BORDER};
-                border-radius: 6px;
-                color: {HTB_TEXT_SEC};
-                font-family: {FONT_FAMILY_MAIN};
-                font-weight: 600;
-                font-size: 13px;
-                padding: 0 16px;
-            }}
-            QPushButton:hover {{
-                background-color: {HTB_BG_CARD};
-                color: {HTB_TEXT_MAIN};
-            }}
-            QPushButton:pressed {{
-                background-color: {HTB_BG_MAIN};
-            }}
-        """)
+            self.setIcon(cached_icon(icon_name, icon_color))
 
 
 class ModernCard(QFrame):
     """
     A card container with subtle borders and shadow.
+    Styled by the ModernCard rule in GLOBAL_STYLE.
     """
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setStyleSheet(f"""
-            ModernCard {{
-                background-color: {HTB_BG_MAIN};
-                border: 1px solid {HTB_BORDER};
-                border-radius: 6px;
-            }}
-        """)
         # Optional: Add shadow if desired, but might affect performance on some updates
         # shadow = QGraphicsDropShadowEffect(self)
         # shadow.setBlurRadius(20)
@@ -96,11 +78,11 @@ class SimpleStatCard(ModernCard):
         # Header with Icon
         header = QHBoxLayout()
         icon = QLabel()
-        icon.setPixmap(qta.icon(icon_name, color=HTB_TEXT_SEC).pixmap(16, 16))
+        icon.setPixmap(cached_icon(icon_name, HTB_TEXT_SEC).pixmap(16, 16))
         icon.setFixedSize(16, 16)
         
         lbl_title = QLabel(title.upper())
-        lbl_title.setStyleSheet(f"color: {HTB_TEXT_SEC}; font-size: 11px; font-weight: 700; letter-spacing: 1px;")
+        lbl_title.setObjectName("statTitle")
         
         header.addWidget(icon)
         header.addWidget(lbl_title)
@@ -109,7 +91,9 @@ class SimpleStatCard(ModernCard):
 
         # Value
         self.lbl_value = QLabel(str(value))
-        self.lbl_value.setStyleSheet(f"color: {color}; font-size: 24px; font-weight: 700;")
+        self.lbl_value.setObjectName("statValue")
+        if color != HTB_GREEN:
+            self.lbl_value.setStyleSheet(_SSC_VALUE_QSS_TMPL.format(color=color))
         layout.addWidget(self.lbl_value)
     
     def set_value(self, val):
@@ -118,25 +102,8 @@ class SimpleStatCard(ModernCard):
 
 class ModernInput(QLineEdit):
     """
-    Styled input field.
+    Styled input field (ModernInput rules in GLOBAL_STYLE).
     """
     def __init__(self, placeholder="", parent=None):
         super().__init__(parent)
         self.setPlaceholderText(placeholder)
-        self.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {HTB_BG_INPUT};
-                border: 1px solid {HTB_BORDER};
-                border-radius: 8px;
-                padding: 10px 14px;
-                color: {HTB_TEXT_MAIN};
-                font-size: 13px;
-            }}
-            QLineEdit:focus {{
-                border: 1px solid {HTB_GREEN};
-                background-color: {HTB_BG_HOVER};
-            }}
-            QLineEdit::placeholder {{
-                color: {HTB_TEXT_MUTED};
-            }}
-        """)
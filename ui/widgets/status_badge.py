@@ -6,25 +6,23 @@ Displays status indicators with colors.
 from PySide6.QtWidgets import QLabel
 from PySide6.QtCore import Qt
 
-from ui.styles import (
-    STATUS_SUCCESS, STATUS_WARNING, STATUS_ERROR, STATUS_INFO,
-    HTB_GREEN, HTB_TEXT_DIM
-)
+from ui.styles import BADGE_STYLES, DIFFICULTY_COLORS
+
+
+def _repolish(widget: QLabel):
+    """Re-evaluate GLOBAL_STYLE property selectors after a property change."""
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
 
 
 class StatusBadge(QLabel):
     """
     Status badge with color-coded background.
+    Colours come from the StatusBadge[badge_style] rules that GLOBAL_STYLE
+    generates from BADGE_STYLES.
     """
     
-    STYLES = {
-        "success": (STATUS_SUCCESS, "#ffffff"),
-        "warning": (STATUS_WARNING, "#000000"),
-        "error": (STATUS_ERROR, "#ffffff"),
-        "info": (STATUS_INFO, "#ffffff"),
-        "htb": (HTB_GREEN, "#000000"),
-        "neutral": (HTB_TEXT_DIM, "#ffffff"),
-    }
+    STYLES = BADGE_STYLES
     
     def __init__(self, text: str, style: str = "neutral", parent=None):
         super().__init__(text, parent)
@@ -33,17 +31,10 @@ class StatusBadge(QLabel):
     def setStatus(self, text: str, style: str = "neutral"):
         """Update the badge status."""
         self.setText(text)
-        
-        bg_color, text_color = self.STYLES.get(style, self.STYLES["neutral"])
-        
-        self.setStyleSheet(f"""
-            background-color: {bg_color};
-            color: {text_color};
-            padding: 4px 12px;
-            border-radius: 12px;
-            font-weight: 600;
-            font-size: 11px;
-        """)
+        style = style if style in self.STYLES else "neutral"
+        if self.property("badge_style") != style:
+            self.setProperty("badge_style", style)
+            _repolish(self)
         
         self.setAlignment(Qt.AlignCenter)
         self.adjustSize()
@@ -52,41 +43,36 @@ class StatusBadge(QLabel):
 class DifficultyBadge(QLabel):
     """
     Difficulty badge with appropriate colors.
+    Colours come from the DifficultyBadge[difficulty] rules that GLOBAL_STYLE
+    generates from DIFFICULTY_COLORS.
     """
     
-    COLORS = {
-        "easy": "#9fef00",
-        "medium": "#ffaf00",
-        "hard": "#ff3e3e",
-        "insane": "#7d3c98",
-    }
+    COLORS = DIFFICULTY_COLORS
     
     def __init__(self, difficulty: str, parent=None):
-        super().__init__(difficulty, parent)
+        super().__init__(parent)
+        self._difficulty = None
+        self.setAlignment(Qt.AlignCenter)
         self.setDifficulty(difficulty)
     
     def setDifficulty(self, difficulty: str):
         """Update the difficulty badge."""
+        if difficulty == self._difficulty:
+            return  # list refreshes mostly re-set the same value
+        self._difficulty = difficulty
         self.setText(difficulty)
+        key = difficulty.casefold()
+        key = key if key in self.COLORS else ""
+        if self.property("difficulty") != key:
+            self.setProperty("difficulty", key)
+            _repolish(self)
         
-        color = self.COLORS.get(difficulty.lower(), "#ffffff")
-        
-        self.setStyleSheet(f"""
-            background-color: {color}20;
-            color: {color};
-            padding: 4px 12px;
-            border-radius: 12px;
-            font-weight: 600;
-            font-size: 11px;
-        """)
-        
-        self.setAlignment(Qt.AlignCenter)
         self.adjustSize()
 
 
 class OSBadge(QLabel):
     """
-    Operating system badge with icon.
+    Operating system badge with icon (OSBadge rule in GLOBAL_STYLE).
     """
     
     ICONS = {
@@ -99,22 +85,16 @@ class OSBadge(QLabel):
     
     def __init__(self, os_name: str, parent=None):
         super().__init__(parent)
+        self._os_name = None
+        self.setAlignment(Qt.AlignCenter)
         self.setOS(os_name)
     
     def setOS(self, os_name: str):
         """Update the OS badge."""
-        os_lower = os_name.lower()
-        icon = self.ICONS.get(os_lower, self.ICONS["other"])
+        if os_name == self._os_name:
+            return
+        self._os_name = os_name
+        icon = self.ICONS.get(os_name.casefold(), self.ICONS["other"])
         
         self.setText(f"{icon} {os_name}")
-        
-        self.setStyleSheet(f"""
-            background-color: #21262d;
-            color: #e6edf3;
-            padding: 4px 12px;
-            border-radius: 12px;
-            font-size: 12px;
-        """)
-        
-        self.setAlignment(Qt.AlignCenter)
         self.adjustSize()
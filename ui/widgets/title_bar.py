@@ -2,19 +2,43 @@
 Custom Title Bar for Frameless Window.
 """
 
+from functools import lru_cache
+
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel, QPushButton, QApplication
 from PySide6.QtCore import Qt, QPoint, QSize
 from PySide6.QtGui import QIcon
 
-import qtawesome as qta
+from ui.widgets.modern_widgets import cached_icon
 from ui.styles import HTB_BG_DARKEST, HTB_TEXT_SEC, HTB_TEXT_MAIN
 
+# The one sheet TitleBar parses, formatted once at import. Scoped to the
+# bar and its labels so the window control rules in GLOBAL_STYLE still apply
+# to the buttons.
+_TITLE_BAR_QSS = (
+    "TitleBar, QLabel { background-color: %s; }"
+    " QLabel#titleLabel { color: %s; font-weight: 600; font-size: 13px; }"
+) % (HTB_BG_DARKEST, HTB_TEXT_MAIN)
+
+_BTN_ICON_SIZE = QSize(16, 16)  # QPushButton's default iconSize
+
+
+@lru_cache(maxsize=16)
+def _control_icon(name: str, dpr: float) -> QIcon:
+    """
+    Window control icon rasterized once at the button's size and DPR.
+    
+    qtawesome icons re-render the glyph on every paint; a plain pixmap
+    icon is just blitted.
+    """
+    return QIcon(cached_icon(name, HTB_TEXT_SEC).pixmap(_BTN_ICON_SIZE, dpr))
+
+
 class TitleBar(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent_window = parent
         self.setFixedHeight(40)
-        self.setStyleSheet(f"background-color: {HTB_BG_DARKEST};")
+        self.setStyleSheet(_TITLE_BAR_QSS)
         
         layout = QHBoxLayout(self)
         layout.setContentsMargins(16, 0, 8, 0)
@@ -22,82 +46,68 @@ class TitleBar(QWidget):
         
         # Icon & Title
         self.icon_lbl = QLabel()
-        self.icon_lbl.setPixmap(qta.icon("fa5s.terminal", color=HTB_TEXT_MAIN).pixmap(16, 16))
+        dpr = self.devicePixelRatioF()
+        self.icon_lbl.setPixmap(cached_icon("fa5s.terminal", HTB_TEXT_MAIN).pixmap(QSize(16, 16), dpr))
         
         self.title_lbl = QLabel("HTB Client")
-        self.title_lbl.setStyleSheet(f"color: {HTB_TEXT_MAIN}; font-weight: 600; font-size: 13px;")
+        self.title_lbl.setObjectName("titleLabel")
         
         layout.addWidget(self.icon_lbl)
         layout.addWidget(self.title_lbl)
         layout.addStretch()
         
-        # Window Controls
-        btn_style = """
-            QPushButton {
-                background: transparent;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 0.1);
-            }
-        """
-        
+        # Window Controls (styled by the TitleBar rules in GLOBAL_STYLE)
         self.btn_min = QPushButton()
-        self.btn_min.setIcon(qta.icon("fa5s.minus", color=HTB_TEXT_SEC))
+        self.btn_min.setObjectName("titleBtn")
+        self.btn_min.setIcon(_control_icon("fa5s.minus", dpr))
         self.btn_min.setFixedSize(30, 30)
-        self.btn_min.setStyleSheet(btn_style)
         self.btn_min.clicked.connect(self.minimize_window)
         
         self.btn_max = QPushButton()
-        self.btn_max.setIcon(qta.icon("fa5s.expand", color=HTB_TEXT_SEC))
+        self.btn_max.setObjectName("titleBtn")
+        self.btn_max.setIcon(_control_icon("fa5s.expand", dpr))
         self.btn_max.setFixedSize(30, 30)
-        self.btn_max.setStyleSheet(btn_style)
         self.btn_max.clicked.connect(self.maximize_restore_window)
         
         self.btn_close = QPushButton()
-        self.btn_close.setIcon(qta.icon("fa5s.times", color=HTB_TEXT_SEC))
+        self.btn_close.setObjectName("titleBtnClose")
+        self.btn_close.setIcon(_control_icon("fa5s.times", dpr))
         self.btn_close.setFixedSize(30, 30)
-        self.btn_close.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #ff2a6d;
-                color: white;
-            }
-        """)
         self.btn_close.clicked.connect(self.close_window)
         
         layout.addWidget(self.btn_min)
         layout.addWidget(self.btn_max)
         layout.addWidget(self.btn_close)
         
-        # Mouse tracking for dragging
-        self.start_pos = None
+        # Cursor offset from the window's top-left, fixed for the whole drag
+        self._drag_offset = None
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
-            self.start_pos = event.globalPosition().toPoint() - self.parent_window.frameGeometry().topLeft()
+            self._drag_offset = event.globalPosition().toPoint() - self.parent_window.frameGeometry().topLeft()
             event.accept()
 
     def mouseMoveEvent(self, event):
-        if event.buttons() & Qt.LeftButton and self.start_pos:
-            self.parent_window.move(event.globalPosition().toPoint() - self.start_pos)
+        # "is not None": a QPoint(0, 0) offset is falsy but still valid
+        if self._drag_offset is not None and event.buttons() & Qt.LeftButton:
+            self.parent_window.move(event.globalPosition().toPoint() - self._drag_offset)
             event.accept()
 
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self._drag_offset = None
+        super().mouseReleaseEvent(event)
+
     def minimize_window(self):
         self.parent_window.showMinimized()
 
     def maximize_restore_window(self):
         if self.parent_window.isMaximized():
             self.parent_window.showNormal()
-            self.btn_max.setIcon(qta.icon("fa5s.expand", color=HTB_TEXT_SEC))
+            self.btn_max.setIcon(_control_icon("fa5s.expand", self.devicePixelRatioF()))
         else:
             self.parent_window.showMaximized()
-            self.btn_max.setIcon(qta.icon("fa5s.compress", color=HTB_TEXT_SEC))
+            self.btn_max.setIcon(_control_icon("fa5s.compress", self.devicePixelRatioF()))
 
     def close_window(self):
         self.parent_window.close()
@@ -3,12 +3,60 @@ Debug utilities for HTB Client.
 Provides logging and debugging helpers.
 """
 
+import atexit
 import json
-from datetime import datetime
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Optional
 
 from config import config
 
+_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+_logger: Optional[logging.Logger] = None
+
+
+def _get_logger() -> logging.Logger:
+    """
+    Logger whose records are formatted and written by a background listener.
+    
+    Callers only enqueue; the timestamp (taken at call time) is rendered and
+    stdout is written on the listener thread. Started on first use so a
+    session with debug off never spawns the thread.
+    """
+    global _logger
+    if _logger is None:
+        records = queue.SimpleQueue()
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("[%(asctime)s.%(msecs)03d] %(message)s", "%H:%M:%S"))
+        listener = QueueListener(records, handler)
+        listener.start()
+        atexit.register(listener.stop)  # flush what's queued on exit
+        logger = logging.getLogger("htb.debug")
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        logger.addHandler(QueueHandler(records))
+        _logger = logger
+    return _logger
+
+
+def _dump_truncated(data: Any, limit: int = 1000) -> str:
+    """
+    JSON-format data, stopping once limit characters have been produced.
+    
+    Large API responses are only encoded as far as the log will show them.
+    """
+    chunks = []
+    total = 0
+    for chunk in _ENCODER.iterencode(data):
+        chunks.append(chunk)
+        total += len(chunk)
+        if total > limit:
+            return "".join(chunks)[:limit] + "\n... (truncated)"
+    return "".join(chunks)
+
 
 def debug_log(category: str, message: str, data: Any = None):
     """
@@ -22,25 +70,26 @@ def debug_log(category: str, message: str, data: Any = None):
     if not config.debug:
         return
     
-    timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-    print(f"[{timestamp}] [{category}] {message}")
+    if data is None:
+        _get_logger().debug("[%s] %s", category, message)
+        return
     
-    if data is not None:
-        try:
-            if isinstance(data, (dict, list)):
-                formatted = json.dumps(data, indent=2, ensure_ascii=False)
-                # Limit output for large responses
-                if len(formatted) > 1000:
-                    formatted = formatted[:1000] + "\n... (truncated)"
-                print(formatted)
-            else:
-                print(f"  → {data}")
-        except Exception as e:
-            print(f"  → (could not format data: {e})")
+    # Data goes in the same record so its lines stay together across threads
+    try:
+        if isinstance(data, (dict, list)):
+            # Limit output for large responses
+            detail = _dump_truncated(data)
+        else:
+            detail = f"  → {data}"
+    except Exception as e:
+        detail = f"  → (could not format data: {e})"
+    _get_logger().debug("[%s] %s\n%s", category, message, detail)
 
 
 def debug_request(method: str, url: str, data: Optional[dict] = None):
     """Log an outgoing HTTP request."""
+    if not config.debug:
+        return
     debug_log("API", f"→ {method} {url}")
     if data:
         debug_log("API", "Request body:", data)
@@ -48,6 +97,8 @@ def debug_request(method: str, url: str, data: Optional[dict] = None):
 
 def debug_response(status_code: int, url: str, data: Any = None, error: str = None):
     """Log an HTTP response."""
+    if not config.debug:
+        return
     if error:
         debug_log("API", f"← ERROR {status_code} {url}: {error}")
     else:
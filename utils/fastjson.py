@@ -0,0 +1,24 @@
+"""
+Fast JSON Module
+Decodes JSON with orjson when it is installed, stdlib json otherwise.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+    
+    Raises ValueError on malformed input (orjson.JSONDecodeError
+    subclasses it), matching json.loads.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
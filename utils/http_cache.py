@@ -0,0 +1,138 @@
+"""
+HTTP Cache Module
+Stores ETag/Last-Modified validators with the last JSON body per URL so
+GET requests can be revalidated with If-None-Match/If-Modified-Since.
+"""
+
+import os
+import json
+import time
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
+
+from config import config, CONFIG_DIR
+
+# Bodies are authenticated API data: keep them in the user's config dir,
+# readable by the owner only
+CACHE_DIR = CONFIG_DIR / "http_cache"
+
+# Entries younger than this are served without contacting the server
+DEFAULT_MAX_AGE = 1.0
+
+# Empty MD5 state; copy() skips the OpenSSL constructor on each new key
+_MD5_PROTO = hashlib.md5()
+
+_cache_dir_ready = False
+
+
+def _ensure_cache_dir():
+    """Create the owner-only cache directory (once per process)."""
+    global _cache_dir_ready
+    if _cache_dir_ready:
+        return
+    CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    os.chmod(CACHE_DIR, 0o700)  # mkdir's mode is ignored for an existing dir
+    _cache_dir_ready = True
+
+
+@lru_cache(maxsize=1024)
+def _token_cache_path(token: str, key: str) -> Path:
+    h = _MD5_PROTO.copy()
+    h.update(token.encode())
+    h.update(b"\0")
+    h.update(key.encode())
+    return CACHE_DIR / f"{h.hexdigest()}.json"
+
+
+def _get_cache_path(key: str) -> Path:
+    """
+    Get cache file path for a request key (hashed once per key).
+    
+    The API token is mixed into the hash, so one account's bodies are never
+    replayed for another.
+    """
+    return _token_cache_path(config.api_token, key)
+
+
+def get_entry(key: str) -> Optional[dict]:
+    """
+    Get a cached response entry.
+    
+    Args:
+        key: Request key (URL + query)
+        
+    Returns:
+        Dict with etag, last_modified, stored_at and body, or None
+    """
+    cache_path = _get_cache_path(key)
+    if not cache_path.exists():
+        return None
+    try:
+        with open(cache_path, "r") as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+
+def is_fresh(entry: dict, max_age: float = DEFAULT_MAX_AGE) -> bool:
+    """Check if an entry is recent enough to skip revalidation."""
+    return time.time() - entry.get("stored_at", 0) < max_age
+
+
+def get_validators(entry: Optional[dict]) -> dict:
+    """Build conditional request headers from a cached entry."""
+    headers = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def save_entry(key: str, headers: dict, body: Any):
+    """
+    Store a response body together with its validators.
+    
+    Args:
+        key: Request key (URL + query)
+        headers: Response headers
+        body: Parsed JSON body
+    """
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return
+    _ensure_cache_dir()
+    try:
+        with open(_get_cache_path(key), "w") as f:
+            json.dump({
+                "etag": etag,
+                "last_modified": last_modified,
+                "stored_at": time.time(),
+                "body": body,
+            }, f)
+    except Exception:
+        pass  # Silently fail on cache save errors
+
+
+def touch_entry(key: str, entry: dict):
+    """Mark an entry as revalidated (after a 304)."""
+    entry["stored_at"] = time.time()
+    try:
+        with open(_get_cache_path(key), "w") as f:
+            json.dump(entry, f)
+    except Exception:
+        pass
+
+
+def clear_cache():
+    """Clear all cached responses."""
+    if CACHE_DIR.exists():
+        for f in CACHE_DIR.iterdir():
+            try:
+                f.unlink()
+            except Exception:
+                pass
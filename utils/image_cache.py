@@ -5,40 +5,182 @@ Caches downloaded images to /tmp for faster loading.
 
 import os
 import hashlib
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from PySide6.QtGui import QPixmap
-from PySide6.QtCore import QByteArray
+from typing import Callable, Iterable, Optional
+from PySide6.QtGui import QPixmap, QPixmapCache, QImage, QImageReader, QPainter
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice, QObject, QRunnable, QThreadPool, Qt, Signal
 
 CACHE_DIR = Path("/tmp/htb_client_cache/images")
+_CACHE_DIR_STR = str(CACHE_DIR)  # hot-path joins use plain str, not Path
+PIXMAP_CACHE_LIMIT = 64 * 1024  # KB of decoded pixmaps kept in memory
+
+_pixmap_cache_limit_set = False
+_cache_dir_ready = False
 
 
 def _ensure_cache_dir():
-    """Create cache directory if it doesn't exist."""
+    """Create cache directory if it doesn't exist (once per process)."""
+    global _cache_dir_ready
+    if _cache_dir_ready:
+        return
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _cache_dir_ready = True
 
 
-def _get_cache_path(url: str) -> Path:
-    """Get cache file path for a URL."""
-    url_hash = hashlib.md5(url.encode()).hexdigest()
-    return CACHE_DIR / f"{url_hash}.png"
+@lru_cache(maxsize=4096)
+def _hash_url(url: str) -> str:
+    """Short, stable file name for a URL (same avatars are looked up repeatedly)."""
+    return hashlib.blake2b(url.encode(), digest_size=10).hexdigest()
 
 
-def get_cached_image(url: str) -> Optional[QPixmap]:
+def _get_cache_path(url: str, size: int = 0) -> str:
+    """
+    Get cache file path for a URL, at full resolution or downscaled to size.
+    
+    Full-size files hold the bytes exactly as served (JPEG/PNG/WebP...),
+    hence the neutral suffix; QPixmap.load() detects the format from the
+    content. Downscaled copies are small PNGs.
+    """
+    if size:
+        return f"{_CACHE_DIR_STR}/{_hash_url(url)}_{size}.png"
+    return f"{_CACHE_DIR_STR}/{_hash_url(url)}.bin"
+
+
+def _memory_key(url: str, size: int = 0) -> str:
+    """QPixmapCache key for a URL at a given decode size."""
+    return f"{url}@{size}" if size else url
+
+
+def setup_pixmap_cache():
+    """Size QPixmapCache (the in-memory tier). Needs a QGuiApplication."""
+    global _pixmap_cache_limit_set
+    QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT)
+    _pixmap_cache_limit_set = True
+
+
+def _remember_pixmap(url: str, pixmap: QPixmap):
+    """Keep a decoded pixmap in the process-wide QPixmapCache."""
+    if not _pixmap_cache_limit_set:
+        # main() sizes it at startup; cover callers that skipped that
+        setup_pixmap_cache()
+    QPixmapCache.insert(url, pixmap)
+
+
+def cached_pixmap(key: str, build: Callable[[], QPixmap]) -> QPixmap:
+    """Return the QPixmapCache entry for key, building and storing it on a miss."""
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        pixmap = build()
+        _remember_pixmap(key, pixmap)
+    return pixmap
+
+
+class _SaveImageTask(QRunnable):
+    """PNG-encodes and writes one downscaled image on a pool thread."""
+    
+    def __init__(self, image: QImage, path: str):
+        super().__init__()
+        self.image = image
+        self.path = path
+    
+    def run(self):
+        try:
+            self.image.save(self.path, "PNG")
+        except Exception:
+            pass  # Silently fail on cache save errors
+
+
+class _SaveTask(QRunnable):
+    """Writes one cached image's original bytes on a pool thread."""
+    
+    def __init__(self, data: bytes, path: str):
+        super().__init__()
+        self.data = data
+        self.path = path
+    
+    def run(self):
+        try:
+            with open(self.path, "wb") as f:
+                f.write(self.data)
+        except Exception:
+            pass  # Silently fail on cache save errors
+
+
+class ImageSignals(QObject):
+    decoded = Signal(str, object)  # url, {decode size (0 = full): QImage}
+
+
+class DecodeImageTask(QRunnable):
+    """
+    Decodes downloaded image bytes on a pool thread.
+    
+    Each requested size is decoded once (0 = full resolution, otherwise via
+    read_scaled_image) and written to the disk cache at that size. Results
+    arrive on signals.decoded; pass each image to cache_decoded() on the
+    GUI thread.
+    """
+    
+    def __init__(self, url: str, data: bytes, sizes: Iterable[int], signals: ImageSignals):
+        super().__init__()
+        self.url = url
+        self.data = data
+        self.sizes = tuple(sizes)
+        self.signals = signals
+    
+    def run(self):
+        images = {}
+        for size in self.sizes:
+            if size:
+                images[size] = read_scaled_image(QByteArray(self.data), size)
+            else:
+                image = QImage()
+                image.loadFromData(self.data)
+                images[0] = image
+        if self.url:
+            _ensure_cache_dir()
+            for size, image in images.items():
+                if image.isNull():
+                    continue
+                path = _get_cache_path(self.url, size)
+                if size:
+                    _SaveImageTask(image, path).run()
+                else:
+                    _SaveTask(self.data, path).run()
+        self.signals.decoded.emit(self.url, images)
+
+
+def cache_decoded(url: str, image: QImage, size: int = 0) -> QPixmap:
+    """Turn a worker-decoded image into a pixmap and keep it in memory (GUI thread)."""
+    pixmap = QPixmap.fromImage(image)
+    if url and not pixmap.isNull():
+        _remember_pixmap(_memory_key(url, size), pixmap)
+    return pixmap
+
+
+def get_cached_image(url: str, size: int = 0) -> Optional[QPixmap]:
     """
     Get image from cache if it exists.
     
+    Decoded pixmaps are served from QPixmapCache; the disk copy is only
+    decoded on a memory miss.
+    
     Args:
         url: The image URL
+        size: Decode size the image was cached at (0 = full resolution)
         
     Returns:
         QPixmap if cached, None otherwise
     """
-    cache_path = _get_cache_path(url)
-    if cache_path.exists():
-        pixmap = QPixmap()
-        if pixmap.load(str(cache_path)):
-            return pixmap
+    key = _memory_key(url, size)
+    pixmap = QPixmapCache.find(key)
+    if pixmap is not None and not pixmap.isNull():
+        return pixmap
+    # No exists() stat first: load() just fails on a missing file
+    pixmap = QPixmap()
+    if pixmap.load(_get_cache_path(url, size)):
+        _remember_pixmap(key, pixmap)
+        return pixmap
     return None
 
 
@@ -56,20 +198,94 @@ def save_to_cache(url: str, data: QByteArray) -> Optional[QPixmap]:
     _ensure_cache_dir()
     pixmap = QPixmap()
     if pixmap.loadFromData(data):
-        cache_path = _get_cache_path(url)
-        try:
-            pixmap.save(str(cache_path), "PNG")
-        except Exception:
-            pass  # Silently fail on cache save errors
+        # Store the network bytes verbatim (no PNG re-encode), written off
+        # the GUI thread; the pixmap is usable right away.
+        QThreadPool.globalInstance().start(_SaveTask(bytes(data), _get_cache_path(url)))
+        _remember_pixmap(url, pixmap)
         return pixmap
     return None
 
 
+def read_scaled_image(data: QByteArray, size: int) -> QImage:
+    """
+    Decode image bytes straight to roughly size x size.
+    
+    The decoder scales while reading (keeping aspect ratio, covering the
+    square), so the full-resolution image is never materialized.
+    """
+    buf = QBuffer(data)
+    buf.open(QIODevice.ReadOnly)
+    reader = QImageReader(buf)
+    reader.setAutoTransform(True)
+    src = reader.size()
+    if src.isValid():
+        reader.setScaledSize(src.scaled(size, size, Qt.KeepAspectRatioByExpanding))
+    image = reader.read()
+    buf.close()
+    return image
+
+
+def scaling_mode(width: int, height: int, size: int) -> Qt.TransformationMode:
+    """
+    Transformation for fitting a width x height image into size x size.
+    
+    Bilinear filtering only pays off when upscaling or shrinking by more
+    than 2x; near-size downscales (the usual avatar case) use the fast path.
+    """
+    short = min(width, height)
+    if size <= short <= size * 2:
+        return Qt.FastTransformation
+    return Qt.SmoothTransformation
+
+
+@lru_cache(maxsize=8)
+def _round_mask(size: int, radius: int = 0) -> QImage:
+    """
+    Antialiased opaque shape on transparent, reused for every avatar of that
+    size: a circle, or a rounded rect when radius is given.
+    """
+    mask = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    mask.fill(Qt.transparent)
+    painter = QPainter(mask)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(Qt.black)
+    if radius:
+        painter.drawRoundedRect(0, 0, size, size, radius, radius)
+    else:
+        painter.drawEllipse(0, 0, size, size)
+    painter.end()
+    return mask
+
+
+def round_image(image: QImage, size: int, radius: int = 0) -> QImage:
+    """
+    Scale an image to size x size and clip it to a circle (or to a rounded
+    rect with the given corner radius).
+    
+    Only touches QImage, so it is safe to call from worker threads.
+    """
+    mode = scaling_mode(image.width(), image.height(), size)
+    scaled = image.scaled(size, size, Qt.KeepAspectRatioByExpanding, mode)
+    rounded = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    rounded.fill(Qt.transparent)
+    painter = QPainter(rounded)
+    painter.drawImage(0, 0, scaled)
+    painter.setCompositionMode(QPainter.CompositionMode_DestinationIn)
+    painter.drawImage(0, 0, _round_mask(size, radius))
+    painter.end()
+    return rounded
+
+
 def clear_cache():
     """Clear all cached images."""
-    if CACHE_DIR.exists():
-        for f in CACHE_DIR.iterdir():
-            try:
-                f.unlink()
-            except Exception:
-                pass
+    QPixmapCache.clear()
+    try:
+        with os.scandir(CACHE_DIR) as entries:
+            for entry in entries:
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
+    except FileNotFoundError:
+        pass